@@ -11,10 +11,16 @@ Typical usage example:
     converter.save('output.md')
 """
 
-from epub_converter.converter import BookMetadata
-from epub_converter.converter import ConversionOptions
-from epub_converter.converter import ConversionResult
-from epub_converter.converter import EpubToMarkdownConverter
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from epub_converter.converter import BookMetadata
+    from epub_converter.converter import ConversionOptions
+    from epub_converter.converter import ConversionResult
+    from epub_converter.converter import EpubToMarkdownConverter
 
 __version__ = '2.0.0'
 __author__ = 'kashima19960'
@@ -24,3 +30,31 @@ __all__ = [
     'ConversionOptions',
     'BookMetadata',
 ]
+
+# 延迟导入的公开名称及其所在模块，避免导入包时加载 ebooklib、lxml 等依赖
+_LAZY_EXPORTS = {
+    'EpubToMarkdownConverter': 'epub_converter.converter',
+    'ConversionResult': 'epub_converter.converter',
+    'ConversionOptions': 'epub_converter.converter',
+    'BookMetadata': 'epub_converter.converter',
+}
+
+
+def __getattr__(name: str):
+    """按需导入公开名称。
+
+    Args:
+        name: 属性名。
+
+    Returns:
+        对应的类。
+
+    Raises:
+        AttributeError: 如果包中没有该名称。
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -13,15 +13,15 @@ Example:
 from __future__ import annotations
 
 import argparse
+import errno
+import os
+import stat
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 from typing import Sequence
 
-from epub_converter.converter import ConversionOptions
-from epub_converter.converter import EpubToMarkdownConverter
-from epub_converter.utils import get_default_output_path
-
 
 def create_parser() -> argparse.ArgumentParser:
     """创建命令行参数解析器。
@@ -38,6 +38,7 @@ def create_parser() -> argparse.ArgumentParser:
     epub2md book.epub
     epub2md book.epub -o output.md
     epub2md book.epub --no-images
+    epub2md book.epub -j 4
     epub2md --gui
 
 更多信息请访问: https://github.com/kashima19960/epub_to_markdown
@@ -48,7 +49,7 @@ def create_parser() -> argparse.ArgumentParser:
         'epub_file',
         nargs='?',
         type=str,
-        help='EPUB 文件路径'
+        help='EPUB 文件路径，也可以是已解压的 EPUB 目录'
     )
 
     parser.add_argument(
@@ -62,7 +63,7 @@ def create_parser() -> argparse.ArgumentParser:
         '--no-images',
         action='store_true',
         dest='no_images',
-        help='不提取图片'
+        help='不提取图片，输出中也不包含图片链接'
     )
 
     parser.add_argument(
@@ -72,6 +73,14 @@ def create_parser() -> argparse.ArgumentParser:
         help='不生成目录'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        dest='jobs',
+        help='并行转换章节的工作进程数（默认 1，即顺序转换；0 表示使用 CPU 核心数）'
+    )
+
     parser.add_argument(
         '--gui',
         action='store_true',
@@ -87,19 +96,49 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def print_progress(percentage: int, message: str) -> None:
-    """打印进度信息。
+class ProgressPrinter:
+    """终端进度条打印器。
 
-    Args:
-        percentage: 进度百分比。
-        message: 状态消息。
+    百分比未变化且距上次输出不足最小间隔时跳过本次刷新，
+    避免章节很多的书籍在每个章节都写一次终端。
+
+    Attributes:
+        min_interval: 百分比不变时两次输出之间的最小间隔（秒）。
     """
-    bar_length = 30
-    filled = int(bar_length * percentage / 100)
-    bar = '█' * filled + '░' * (bar_length - filled)
-    print(f'\r[{bar}] {percentage:3d}% {message}', end='', flush=True)
-    if percentage == 100:
-        print()
+
+    BAR_LENGTH = 30
+
+    def __init__(self, min_interval: float = 0.05) -> None:
+        """初始化打印器。
+
+        Args:
+            min_interval: 百分比不变时两次输出之间的最小间隔（秒）。
+        """
+        self.min_interval = min_interval
+        self._last_percentage: Optional[int] = None
+        self._last_time = 0.0
+
+    def __call__(self, percentage: int, message: str) -> None:
+        """打印进度信息。
+
+        Args:
+            percentage: 进度百分比。
+            message: 状态消息。
+        """
+        now = time.monotonic()
+        if (percentage == self._last_percentage and
+                now - self._last_time < self.min_interval):
+            return
+        self._last_percentage = percentage
+        self._last_time = now
+
+        filled = int(self.BAR_LENGTH * percentage / 100)
+        bar = '█' * filled + '░' * (self.BAR_LENGTH - filled)
+        line = f'\r[{bar}] {percentage:3d}% {message}'
+        if percentage == 100:
+            line += '\n'
+        sys.stdout.write(line)
+        sys.stdout.flush()
 
 
 def run_cli(args: argparse.Namespace) -> int:
@@ -115,19 +154,36 @@ def run_cli(args: argparse.Namespace) -> int:
     if args.gui:
         return launch_gui()
 
+    # 延迟导入转换器，使 --help、--version 和 --gui 无需加载解析依赖
+    from epub_converter.converter import ConversionOptions
+    from epub_converter.converter import EpubToMarkdownConverter
+    from epub_converter.utils import get_default_output_path
+
     # 检查输入文件
     if not args.epub_file:
         print('错误: 请指定 EPUB 文件路径，或使用 --gui 启动图形界面')
         print('使用 --help 查看帮助信息')
         return 1
 
+    if args.jobs < 0:
+        print(f'错误: 工作进程数不能为负数 - {args.jobs}')
+        return 1
+
     epub_path = Path(args.epub_file)
 
-    if not epub_path.exists():
-        print(f'错误: 文件不存在 - {epub_path}')
+    # 只做一次 stat 调用，按 errno 区分错误原因
+    try:
+        st = os.stat(epub_path)
+    except OSError as e:
+        if e.errno == errno.ENOENT:
+            print(f'错误: 文件不存在 - {epub_path}')
+        else:
+            print(f'错误: 无法访问文件 - {epub_path} ({e.strerror})')
         return 1
 
-    if epub_path.suffix.lower() != '.epub':
+    # 目录视为已解压的 EPUB，不检查扩展名
+    is_expanded = stat.S_ISDIR(st.st_mode)
+    if not is_expanded and not epub_path.name.lower().endswith('.epub'):
         print(f'错误: 不是有效的 EPUB 文件 - {epub_path}')
         return 1
 
@@ -140,7 +196,8 @@ def run_cli(args: argparse.Namespace) -> int:
     # 配置选项
     options = ConversionOptions(
         extract_images=not args.no_images,
-        generate_toc=not args.no_toc
+        generate_toc=not args.no_toc,
+        num_workers=args.jobs
     )
 
     print(f'正在转换: {epub_path.name}')
@@ -148,8 +205,11 @@ def run_cli(args: argparse.Namespace) -> int:
     print()
 
     try:
-        converter = EpubToMarkdownConverter(epub_path, options)
-        result = converter.save(output_path, progress_callback=print_progress)
+        with EpubToMarkdownConverter(epub_path, options) as converter:
+            result = converter.save(
+                output_path,
+                progress_callback=ProgressPrinter()
+            )
 
         print()
         if result.success:
@@ -157,6 +217,8 @@ def run_cli(args: argparse.Namespace) -> int:
             print(f'  Markdown 文件: {result.markdown_path}')
             if result.image_count > 0:
                 print(f'  提取图片: {result.image_count} 张')
+            for warning in result.warnings:
+                print(f'  警告: {warning}')
             return 0
         else:
             print(f'✗ 转换失败: {result.error_message}')
@@ -14,28 +14,249 @@ Typical usage example:
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import io
+import mmap
 import os
+import posixpath
 import re
-import warnings
+import sys
+import zipfile
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
+from typing import BinaryIO
 from typing import Callable
+from typing import Iterator
 from typing import Optional
 from typing import Union
 
 import ebooklib
-from bs4 import BeautifulSoup
-from bs4 import NavigableString
-from bs4 import Tag
-from bs4 import XMLParsedAsHTMLWarning
 from ebooklib import epub
+from lxml import etree
+
+# 数据类在 Python 3.10 及以上使用 __slots__，去掉每个实例的 __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# 章节 HTML 解析器，容错解析并在所有章节间复用
+_HTML_PARSER = etree.HTMLParser(recover=True, encoding='utf-8')
+
+# META-INF/container.xml 的命名空间
+_CONTAINER_NS = 'urn:oasis:names:tc:opendocument:xmlns:container'
+
+# HTML 中的 ASCII 空白字符
+_ASCII_SPACES = ' \n\t\f\r'
+
+# 转换热路径上使用的正则表达式，在模块导入时预编译
+_RE_WS = re.compile(r'[ \t]+')
+_RE_MULTI_NL = re.compile(r'\n{3,}')
+_RE_TRAIL_DIV = re.compile(r'(\n---\n)+$')
+# 标题级别判断：括号序号、日期前缀、2-4 个汉字的短标题，
+# 合并为一个按顺序尝试的模式，一次匹配即可由 lastgroup 得知命中的分支
+_RE_TITLE_HINT = re.compile(
+    r'(?P<section_num>[（\(][一二三四五六七八九十\d]+[）\)]$)'
+    r'|(?P<date_prefix>\d{4}年\d{1,2}月\d{1,2}日)'
+    r'|(?P<short_cjk>[\u4e00-\u9fa5]{2,4}$)'
+)
+# 图片相对路径前缀：上级目录与当前目录
+_RE_REL_PATH_UP = re.compile(r'^(\.\./)+')
+_RE_REL_PATH_DOT = re.compile(r'^\./+')
+# 文档末尾可能被清理掉的空白与分隔线，流式输出时暂缓写出
+_RE_PENDING_TAIL = re.compile(r'(?:\s|\n---\n)*\Z')
+
+# 加载 EPUB 时可预期的失败：格式错误、缺少成员、读取失败、
+# 空文件无法映射到内存，以及 container.xml/OPF 解析失败
+_LOAD_ERRORS = (
+    epub.EpubException,
+    zipfile.BadZipFile,
+    KeyError,
+    OSError,
+    ValueError,
+    etree.LxmlError,
+)
+
+# 章节数少于该值时顺序转换，避免启动进程池的开销超过并行收益
+_MIN_PARALLEL_CHAPTERS = 4
+
+# 并行转换时每个工作进程对应的已提交、尚未输出的章节数
+_CHAPTERS_PER_WORKER = 2
+
+# 章节之间的分隔线
+_CHAPTER_SEPARATOR = '\n\n---\n\n'
+
+# 生成锚点时的单字符替换表：空格转为连字符，去掉中英文括号
+_ANCHOR_TABLE = str.maketrans({
+    ' ': '-',
+    '（': None,
+    '）': None,
+    '(': None,
+    ')': None,
+})
+
+# 标题识别使用的预编译 XPath：是否包含 bold span、所有包含 bold span 的段落
+_HAS_BOLD_SPAN = etree.XPath("boolean(.//span[contains(@class, 'bold')])")
+_BOLD_PARAGRAPHS = etree.XPath(".//p[.//span[contains(@class, 'bold')]]")
+
+# 目录页识别：指向 index_split_ 分页文件的链接数量
+_COUNT_SPLIT_LINKS = etree.XPath("count(//a[starts-with(@href, 'index_split_')])")
+
+# 仅包裹内容、不产生额外 Markdown 标记的容器标签
+_CONTAINER_TAGS = frozenset({'html', 'body', 'div', 'section', 'article', 'main'})
+
+# 标准标题标签
+_HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+
+# 不作为标题识别的常见页面名称
+_NON_TITLE_TEXTS = frozenset({'版权信息', '目录', '封面', '扉页'})
+
+# 复制图片时使用的缓冲区大小
+_COPY_BUFFER_SIZE = 1 << 20
+
+
+def _copy_stream(src: BinaryIO, dst: BinaryIO, buffer: bytearray) -> None:
+    """借助调用方提供的缓冲区把 src 的全部内容复制到 dst。
+
+    缓冲区由调用方在一次保存过程中复用，不能在线程之间共享。
+
+    Args:
+        src: 支持 readinto 的源文件对象。
+        dst: 目标文件对象。
+        buffer: 复制时使用的缓冲区。
+    """
+    view = memoryview(buffer)
+    while True:
+        n = src.readinto(view)
+        if not n:
+            break
+        dst.write(view[:n])
+
+
+def _remove_elements(root: etree._Element, *tags: str) -> None:
+    """从文档树中删除指定标签的元素，保留其后的文本。
+
+    `etree.strip_elements` 会把被删元素的 tail 并入前一段文本，
+    `_get_text` 按片段分隔与去除空白时结果就会改变。这里用空注释
+    占住被删元素的位置，tail 仍是独立的文本片段；注释本身不产生输出。
+
+    Args:
+        root: 文档根元素。
+        *tags: 要删除的标签名。
+    """
+    for element in list(root.iter(*tags)):
+        parent = element.getparent()
+        if parent is None:
+            continue
+        if element.tail:
+            placeholder = etree.Comment()
+            placeholder.tail = element.tail
+            parent.replace(element, placeholder)
+        else:
+            parent.remove(element)
+
+
+class _MappedFile(mmap.mmap):
+    """可直接交给 `zipfile.ZipFile` 读取的只读内存映射文件。
+
+    Python 3.13 之前的 mmap 没有 `seekable` 方法，而 zipfile 读取成员时需要它。
+    """
+
+    def seekable(self) -> bool:
+        """内存映射总是可以随机访问。"""
+        return True
 
-# 忽略 XML 作为 HTML 解析的警告
-warnings.filterwarnings('ignore', category=XMLParsedAsHTMLWarning)
 
+class _ZipSource:
+    """从 EPUB 压缩包中读取成员。
+
+    文件以只读方式映射到内存，由操作系统按需换入实际访问到的区域；
+    中央目录只索引一次，之后按 ZipInfo 直接读取成员。
+    """
+
+    def __init__(self, path: Path):
+        """打开压缩包。
+
+        Args:
+            path: EPUB 文件路径。
+        """
+        with open(path, 'rb') as f:
+            self._mmap = _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._zip = zipfile.ZipFile(self._mmap, 'r')
+        except Exception:
+            self._mmap.close()
+            raise
+        self._infos = {info.filename: info for info in self._zip.infolist()}
+
+    def read(self, name: str) -> bytes:
+        """读取成员的全部内容。
+
+        Raises:
+            KeyError: 如果压缩包中没有该成员。
+        """
+        return self._zip.read(self._infos[name])
+
+    def open(self, name: str) -> BinaryIO:
+        """以流的方式打开成员。
+
+        Raises:
+            KeyError: 如果压缩包中没有该成员。
+        """
+        return self._zip.open(self._infos[name])
+
+    def close(self) -> None:
+        """关闭压缩包及其内存映射。"""
+        self._zip.close()
+        self._mmap.close()
+
+
+class _DirSource:
+    """从已解压的 EPUB 目录中直接读取文件，不经过任何 zip 解码。"""
+
+    def __init__(self, path: Path):
+        """记录解压目录。
+
+        Args:
+            path: 解压后的 EPUB 根目录。
+        """
+        self._root = path
+
+    def _resolve(self, name: str) -> Path:
+        """将成员路径转换为目录中的文件路径。
 
-@dataclass
+        Raises:
+            KeyError: 如果目录中没有该文件。
+        """
+        file_path = self._root / name
+        if not file_path.is_file():
+            raise KeyError(name)
+        return file_path
+
+    def read(self, name: str) -> bytes:
+        """读取文件的全部内容。
+
+        Raises:
+            KeyError: 如果目录中没有该文件。
+        """
+        return self._resolve(name).read_bytes()
+
+    def open(self, name: str) -> BinaryIO:
+        """以二进制方式打开文件。
+
+        Raises:
+            KeyError: 如果目录中没有该文件。
+        """
+        return open(self._resolve(name), 'rb')
+
+    def close(self) -> None:
+        """目录来源无需释放资源。"""
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class BookMetadata:
     """书籍元数据。
 
@@ -73,22 +294,28 @@ class BookMetadata:
         return result
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ConversionOptions:
     """转换选项配置。
 
     Attributes:
-        extract_images: 是否提取图片。
+        extract_images: 是否提取图片，为 False 时输出中也不包含图片链接。
         generate_toc: 是否生成目录。
         image_dir: 图片输出目录名。
+        num_workers: 并行转换章节的进程数。None 或 1 表示在当前进程中
+            顺序转换，0 表示使用 CPU 核心数。章节很少时总是顺序转换。
+            进程池在 spawn 启动方式（Windows、macOS 的默认方式）下会
+            重新导入主模块，启用时调用方需要有 `if __name__ == '__main__':`
+            保护。
     """
 
     extract_images: bool = True
     generate_toc: bool = True
     image_dir: str = 'images'
+    num_workers: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ConversionResult:
     """转换结果数据类。
 
@@ -97,15 +324,17 @@ class ConversionResult:
         markdown_path: 生成的 Markdown 文件路径。
         image_count: 提取的图片数量。
         error_message: 错误信息（如果失败）。
+        warnings: 未导致失败的问题，例如无法读取或保存的图片。
     """
 
     success: bool
     markdown_path: Optional[Path] = None
     image_count: int = 0
     error_message: Optional[str] = None
+    warnings: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TocItem:
     """目录项。
 
@@ -131,8 +360,8 @@ class EpubToMarkdownConverter:
         options: 转换选项。
 
     Example:
-        >>> converter = EpubToMarkdownConverter('book.epub')
-        >>> result = converter.save('output.md')
+        >>> with EpubToMarkdownConverter('book.epub') as converter:
+        ...     result = converter.save('output.md')
         >>> print(result.success)
         True
     """
@@ -157,27 +386,107 @@ class EpubToMarkdownConverter:
 
         self.options = options or ConversionOptions()
         self._book: Optional[epub.EpubBook] = None
+        self._metadata: Optional[BookMetadata] = None
+        self._converted: Optional[str] = None
+        self._source: Optional[Union[_ZipSource, _DirSource]] = None
+        self._opf_dir: str = ''
         self._markdown_content: list[str] = []
         self._images: dict[str, dict] = {}
+        self._resolved_image_paths: dict[str, str] = {}
         self._toc: list[TocItem] = []
         self._href_to_title: dict[str, dict] = {}
+        self._toc_title_to_level: dict[str, int] = {}
+        self._paragraph_cache: dict[etree._Element, dict] = {}
         self._output_dir: Path = Path('.')
-        self._current_soup: Optional[BeautifulSoup] = None
+        self._chapter_buffer = io.StringIO()
         self._progress_callback: Optional[Callable[[int, str], None]] = None
 
     def _load_epub(self) -> bool:
-        """加载 EPUB 文件。
+        """加载 EPUB 文件，已加载时只确保内容来源处于打开状态。
 
         Returns:
             加载是否成功。
         """
         try:
-            self._book = epub.read_epub(str(self.epub_path))
+            if self._book is None:
+                self._book = epub.read_epub(str(self.epub_path))
+            # close() 之后书籍仍可能保留在内存中，保存图片时需要重新打开来源
+            self._open_source()
             return True
-        except Exception as e:
+        except _LOAD_ERRORS as e:
             self._report_progress(0, f'加载 EPUB 失败: {e}')
             return False
 
+    def _open_source(self) -> None:
+        """打开 EPUB 内容来源并定位 OPF 文件所在目录。
+
+        来源在转换器的整个生命周期内只打开一次。epub_path 为目录时视为
+        已解压的 EPUB，直接读取其中的文件；否则按压缩包读取。
+        """
+        if self._source is not None:
+            return
+
+        if self.epub_path.is_dir():
+            self._source = _DirSource(self.epub_path)
+        else:
+            self._source = _ZipSource(self.epub_path)
+        container = etree.fromstring(self._read('META-INF/container.xml'))
+        for rootfile in container.iter(f'{{{_CONTAINER_NS}}}rootfile'):
+            if rootfile.get('media-type') == 'application/oebps-package+xml':
+                self._opf_dir = posixpath.dirname(rootfile.get('full-path', ''))
+                break
+
+    def _read(self, name: str) -> bytes:
+        """读取 EPUB 中的成员。
+
+        Args:
+            name: 成员在 EPUB 中的完整路径。
+
+        Returns:
+            成员的字节内容。
+
+        Raises:
+            KeyError: 如果 EPUB 中没有该成员。
+        """
+        return self._source.read(name)
+
+    def _open_member(self, name: str) -> BinaryIO:
+        """以流的方式打开 EPUB 中的成员。
+
+        Args:
+            name: 成员在 EPUB 中的完整路径。
+
+        Returns:
+            可读取成员内容的二进制文件对象。
+
+        Raises:
+            KeyError: 如果 EPUB 中没有该成员。
+        """
+        return self._source.open(name)
+
+    def close(self) -> None:
+        """关闭已打开的 EPUB 内容来源。
+
+        缓存的转换结果一并丢弃：之后的 save 需要重新读取图片，
+        因此会重新加载并转换。
+        """
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+        self._converted = None
+
+    def __enter__(self) -> EpubToMarkdownConverter:
+        """进入上下文管理器。
+
+        Returns:
+            转换器自身。
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """退出上下文管理器时关闭 EPUB 内容来源。"""
+        self.close()
+
     def _report_progress(self, percentage: int, message: str) -> None:
         """报告进度。
 
@@ -189,14 +498,16 @@ class EpubToMarkdownConverter:
             self._progress_callback(percentage, message)
 
     def get_metadata(self) -> BookMetadata:
-        """获取书籍元数据。
+        """获取书籍元数据，首次读取后缓存。
 
         Returns:
             包含书籍元数据的 BookMetadata 对象。
         """
-        if not self._book:
-            if not self._load_epub():
-                return BookMetadata()
+        if self._metadata is not None:
+            return self._metadata
+
+        if not self._load_epub():
+            return BookMetadata()
 
         metadata = BookMetadata()
 
@@ -221,6 +532,7 @@ class EpubToMarkdownConverter:
         if description:
             metadata.description = description[0][0]
 
+        self._metadata = metadata
         return metadata
 
     @property
@@ -274,6 +586,10 @@ class EpubToMarkdownConverter:
                     'level': toc_item.level
                 }
 
+        # 建立标题到级别的映射，同名标题以第一次出现的为准
+        for toc_item in toc_items:
+            self._toc_title_to_level.setdefault(toc_item.title, toc_item.level)
+
         self._toc = toc_items
         return toc_items
 
@@ -304,43 +620,91 @@ class EpubToMarkdownConverter:
         Returns:
             锚点字符串。
         """
-        anchor = text.lower()
-        anchor = anchor.replace(' ', '-')
-        anchor = re.sub(r'[（）()]', '', anchor)
-        return anchor
+        return text.lower().translate(_ANCHOR_TABLE)
+
+    @staticmethod
+    def _collapse_blank(text: str) -> str:
+        """将仅由空白组成的文本压缩为单个换行或空格。
+
+        与 BeautifulSoup 的处理方式保持一致，其余文本原样返回。
+
+        Args:
+            text: 文本片段。
+
+        Returns:
+            处理后的文本。
+        """
+        if text.strip(_ASCII_SPACES):
+            return text
+        return '\n' if '\n' in text else ' '
+
+    @classmethod
+    def _get_text(
+        cls,
+        element: etree._Element,
+        separator: str = '',
+        strip: bool = False,
+        preserve_whitespace: bool = False
+    ) -> str:
+        """获取元素及其后代的全部文本（不含注释和元素自身的 tail）。
+
+        Args:
+            element: lxml 元素。
+            separator: 文本片段之间的分隔符。
+            strip: 是否去除每个片段首尾空白并丢弃空片段。
+            preserve_whitespace: 是否保留仅含空白的片段（如 pre 内）。
+
+        Returns:
+            拼接后的文本。
+        """
+        texts = element.itertext()
+        if strip:
+            return separator.join(
+                text.strip() for text in texts if text.strip()
+            )
+        if preserve_whitespace:
+            return separator.join(texts)
+        return separator.join(cls._collapse_blank(text) for text in texts)
 
-    def _is_title_element(self, element: Tag) -> Optional[int]:
-        """判断元素是否是标题，返回标题级别。
+    def _is_title_element(
+        self,
+        element: etree._Element
+    ) -> Optional[tuple[int, str]]:
+        """判断元素是否是标题，返回标题级别和标题文本。
+
+        标题文本在判断过程中已经提取，一并返回以免调用方再次遍历子树。
 
         Args:
-            element: BeautifulSoup 元素。
+            element: lxml 元素。
 
         Returns:
-            标题级别 (1-6)，如果不是标题返回 None。
+            (标题级别 (1-6), 去除首尾空白的标题文本)，如果不是标题返回 None。
         """
-        if not isinstance(element, Tag):
+        if not isinstance(element.tag, str):
             return None
 
-        tag_name = element.name.lower() if element.name else ''
+        tag_name = element.tag
 
         # 标准 h1-h6 标签
-        if tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            return int(tag_name[1])
+        if tag_name in _HEADING_TAGS:
+            return int(tag_name[1]), self._get_text(element).strip()
 
         # 检查是否是 p 标签包含 bold span 的模式
         if tag_name == 'p':
-            bold_span = element.find(
-                'span',
-                class_=lambda x: x and 'bold' in str(x)
-            )
-            if bold_span:
-                text = element.get_text().strip()
+            if _HAS_BOLD_SPAN(element):
+                text = self._get_text(element).strip()
                 if len(text) < 100 and text:
-                    return self._determine_title_level(element, text)
+                    level = self._determine_title_level(element, text)
+                    if level:
+                        return level, text
 
         return None
 
-    def _determine_title_level(self, element: Tag, text: str) -> Optional[int]:
+    def _determine_title_level(
+        self,
+        element: etree._Element,
+        text: str
+    ) -> Optional[int]:
         """确定标题级别。
 
         Args:
@@ -351,39 +715,37 @@ class EpubToMarkdownConverter:
             标题级别，不是标题返回 None。
         """
         # 检查是否在 TOC 中
-        for item in self._toc:
-            if item.title == text:
-                return item.level + 1
-
-        # 检查是否像小节标题
-        if re.match(r'^[（\(][一二三四五六七八九十\d]+[）\)]$', text):
-            return 3
+        toc_level = self._toc_title_to_level.get(text)
+        if toc_level is not None:
+            return toc_level + 1
+
+        hint = _RE_TITLE_HINT.match(text)
+        if hint is not None:
+            # 像小节标题的括号序号
+            if hint.lastgroup == 'section_num':
+                return 3
+            # 日期开头的正文，或不在目录中（目录中的标题已在上面返回）的短文本
+            return None
 
         # 排除明显不是标题的内容
-        if re.match(r'^\d{4}年\d{1,2}月\d{1,2}日', text):
-            return None
-        if re.match(r'^[\u4e00-\u9fa5]{2,4}$', text):
-            toc_titles = [item.title for item in self._toc]
-            if text not in toc_titles:
-                return None
-        if text in ['版权信息', '目录', '封面', '扉页']:
+        if text in _NON_TITLE_TEXTS:
             return None
 
         # 检查是否是章节标题
         if len(text) <= 30:
-            parent = element.parent
-            if parent:
-                all_bold_p = [
-                    p for p in parent.find_all('p')
-                    if p.find('span', class_=lambda x: x and 'bold' in str(x))
-                ]
-                if all_bold_p and element == all_bold_p[0]:
+            parent = element.getparent()
+            if parent is not None:
+                if element is self._first_bold_paragraph(parent):
                     if self._has_content_after(parent, element):
                         return 2
 
         return None
 
-    def _has_content_after(self, parent: Tag, element: Tag) -> bool:
+    def _has_content_after(
+        self,
+        parent: etree._Element,
+        element: etree._Element
+    ) -> bool:
         """检查元素后面是否有正文内容。
 
         Args:
@@ -393,21 +755,62 @@ class EpubToMarkdownConverter:
         Returns:
             是否有后续内容。
         """
-        all_p = parent.find_all('p')
-        found_self = False
-        for p in all_p:
-            if p == element:
-                found_self = True
-                continue
-            if found_self:
-                p_text = p.get_text().strip()
-                if len(p_text) > 50:
-                    return True
-        return False
+        return self._paragraph_index(parent)['has_content_after'].get(
+            element, False
+        )
+
+    def _first_bold_paragraph(
+        self,
+        parent: etree._Element
+    ) -> Optional[etree._Element]:
+        """获取父元素下第一个仍在树中的粗体段落。
+
+        Args:
+            parent: 父元素。
+
+        Returns:
+            第一个包含 bold span 的段落，没有则返回 None。
+        """
+        for p in self._paragraph_index(parent)['bold']:
+            # 已被替换为标题的段落会脱离文档树
+            if p.getparent() is not None:
+                return p
+        return None
+
+    def _paragraph_index(self, parent: etree._Element) -> dict:
+        """获取父元素下段落的缓存索引，每个父元素每章只扫描一次。
+
+        预处理按文档顺序进行，只会替换当前段落之前的段落，因此索引中
+        当前段落之后的信息在整章预处理期间保持有效。
+
+        Args:
+            parent: 父元素。
+
+        Returns:
+            包含 bold（粗体段落列表）和 has_content_after
+            （段落之后是否有长正文段落）的字典。
+        """
+        index = self._paragraph_cache.get(parent)
+        if index is None:
+            has_content_after: dict[etree._Element, bool] = {}
+            found = False
+            for p in reversed(list(parent.iterdescendants('p'))):
+                has_content_after[p] = found
+                if not found and len(self._get_text(p).strip()) > 50:
+                    found = True
+            index = {
+                'bold': _BOLD_PARAGRAPHS(parent),
+                'has_content_after': has_content_after
+            }
+            self._paragraph_cache[parent] = index
+        return index
 
     def _extract_images(self) -> dict[str, dict]:
         """提取 EPUB 中的所有图片。
 
+        内容完全相同的图片（按 SHA-1 判断）共用同一个输出文件，
+        Markdown 中的引用也会指向该文件。
+
         Returns:
             图片路径映射字典。
         """
@@ -415,39 +818,55 @@ class EpubToMarkdownConverter:
             return {}
 
         image_map: dict[str, dict] = {}
+        digest_to_name: dict[bytes, str] = {}
+        existing_names: set[str] = set()
+
+        for item in self._book.get_items_of_type(ebooklib.ITEM_IMAGE):
+            original_name = item.get_name()
+            base_name = os.path.basename(original_name)
+            digest = hashlib.sha1(item.get_content()).digest()
+            # 保存时直接从 EPUB 流式读取，这里释放 ebooklib 预先读入的图片数据
+            item.content = b''
+            file_name = digest_to_name.get(digest)
 
-        for item in self._book.get_items():
-            if item.get_type() == ebooklib.ITEM_IMAGE:
-                original_name = item.get_name()
-                file_name = os.path.basename(original_name)
+            if file_name is None:
+                file_name = base_name
 
                 # 确保文件名唯一
-                existing_names = [v['new_name'] for v in image_map.values()]
                 if file_name in existing_names:
                     name, ext = os.path.splitext(file_name)
                     counter = 1
                     while f'{name}_{counter}{ext}' in existing_names:
                         counter += 1
                     file_name = f'{name}_{counter}{ext}'
-
-                image_map[original_name] = {
-                    'new_name': file_name,
-                    'data': item.get_content()
-                }
-
-                # 添加可能的引用路径变体
-                base_name = os.path.basename(original_name)
-                if base_name not in image_map:
-                    image_map[base_name] = image_map[original_name]
+                existing_names.add(file_name)
+                digest_to_name[digest] = file_name
+
+            image_map[original_name] = {
+                'new_name': file_name,
+                # 清单中的 href 可能含有 ../ 或 ./，与 ebooklib 一样先规范化
+                'zip_path': posixpath.normpath(
+                    posixpath.join(self._opf_dir, original_name)
+                ),
+                'base_name': base_name
+            }
+
+            # 添加可能的引用路径变体
+            if base_name not in image_map:
+                image_map[base_name] = image_map[original_name]
 
         self._images = image_map
+        self._resolved_image_paths = {}
         return image_map
 
-    def _save_images(self, output_dir: Path) -> int:
+    def _save_images(self, output_dir: Path, warnings: list[str]) -> int:
         """保存提取的图片到指定目录。
 
+        单张图片读取或写入失败不会中断保存，失败原因追加到 warnings。
+
         Args:
             output_dir: 输出目录路径。
+            warnings: 收集警告信息的列表。
 
         Returns:
             保存的图片数量。
@@ -457,35 +876,66 @@ class EpubToMarkdownConverter:
 
         image_output_dir = output_dir / self.options.image_dir
         image_output_dir.mkdir(parents=True, exist_ok=True)
+        # 循环中只做字符串拼接，不再为每张图片构造 Path 对象
+        image_dir_str = os.fspath(image_output_dir)
 
         saved_count = 0
         saved_names: set[str] = set()
+        # 每次保存只分配一个缓冲区，所有图片复用；不跨转换器共享以保证线程安全
+        buffer = bytearray(_COPY_BUFFER_SIZE)
+        # 同一张图片以完整路径和文件名两个键登记，失败时只尝试并报告一次
+        attempted_paths: set[str] = set()
 
         for image_info in self._images.values():
             new_name = image_info['new_name']
-            if new_name in saved_names:
+            zip_path = image_info['zip_path']
+            if new_name in saved_names or zip_path in attempted_paths:
                 continue
+            attempted_paths.add(zip_path)
 
-            image_path = image_output_dir / new_name
+            image_path = os.path.join(image_dir_str, new_name)
             try:
-                with open(image_path, 'wb') as f:
-                    f.write(image_info['data'])
+                with self._open_member(zip_path) as src, \
+                        open(image_path, 'wb') as dst:
+                    _copy_stream(src, dst, buffer)
                 saved_count += 1
                 saved_names.add(new_name)
-            except OSError:
-                pass  # 忽略保存失败的图片
+            except KeyError:
+                warnings.append(f'EPUB 中找不到图片: {zip_path}')
+            except OSError as e:
+                warnings.append(f'无法保存图片 {new_name}: {e}')
 
         return saved_count
 
     def _get_new_image_path(self, original_src: str) -> str:
         """获取图片的新路径。
 
+        同一个 src 在书中往往被多次引用，解析结果按 src 缓存，
+        模糊匹配的遍历每个不同的 src 只做一次。
+
         Args:
             original_src: 原始图片路径。
 
         Returns:
             新的相对路径。
         """
+        new_path = self._resolved_image_paths.get(original_src)
+        if new_path is None:
+            new_path = self._resolve_image_path(original_src)
+            self._resolved_image_paths[original_src] = new_path
+        return new_path
+
+    def _resolve_image_path(self, original_src: str) -> str:
+        """解析图片引用对应的提取后路径。
+
+        依次尝试完整路径、文件名，最后按路径后缀模糊匹配。
+
+        Args:
+            original_src: 原始图片路径。
+
+        Returns:
+            新的相对路径，无法匹配时返回原始路径。
+        """
         if original_src in self._images:
             return f"{self.options.image_dir}/{self._images[original_src]['new_name']}"
 
@@ -493,197 +943,255 @@ class EpubToMarkdownConverter:
         if base_name in self._images:
             return f"{self.options.image_dir}/{self._images[base_name]['new_name']}"
 
-        cleaned_src = re.sub(r'^(\.\./)+', '', original_src)
-        cleaned_src = re.sub(r'^\./+', '', cleaned_src)
+        cleaned_src = _RE_REL_PATH_UP.sub('', original_src)
+        cleaned_src = _RE_REL_PATH_DOT.sub('', cleaned_src)
 
         for orig_path, image_info in self._images.items():
             if (orig_path.endswith(cleaned_src) or
-                    cleaned_src.endswith(os.path.basename(orig_path))):
+                    cleaned_src.endswith(image_info['base_name'])):
                 return f"{self.options.image_dir}/{image_info['new_name']}"
 
         return original_src
 
-    def _html_to_markdown(self, html_content: str) -> str:
-        """将 HTML 内容转换为 Markdown。
+    def _html_to_markdown(self, root: etree._Element) -> str:
+        """将已解析的 HTML 文档转换为 Markdown。
+
+        转换过程会修改并逐步释放传入的文档树。
 
         Args:
-            html_content: HTML 内容字符串。
+            root: lxml 解析得到的 HTML 根元素。
 
         Returns:
             Markdown 格式的字符串。
         """
-        self._current_soup = BeautifulSoup(html_content, 'lxml')
+        # 移除脚本和样式（保留其后的文本）
+        _remove_elements(root, 'script', 'style', 'head', 'meta', 'link')
 
-        # 移除脚本和样式
-        for tag in self._current_soup(['script', 'style', 'head', 'meta', 'link']):
-            tag.decompose()
+        # 不提取图片时直接去掉图片节点，不再为其生成指向书内路径的链接
+        if not self.options.extract_images:
+            _remove_elements(root, 'img')
 
-        body = self._current_soup.find('body')
-        content = body if body else self._current_soup
+        body = root.find('body')
+        content = body if body is not None else root
 
         # 预处理标题
         self._preprocess_headings(content)
 
-        markdown = self._process_element(content)
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
+        # 复用同一个缓冲区组装各章节，避免每章重新分配
+        buf = self._chapter_buffer
+        buf.seek(0)
+        buf.truncate(0)
+        self._process_blocks(content, buf)
+        markdown = _RE_MULTI_NL.sub('\n\n', buf.getvalue())
 
         return markdown.strip()
 
-    def _preprocess_headings(self, soup_content: Tag) -> None:
+    def _preprocess_headings(self, content: etree._Element) -> None:
         """预处理 HTML，将基于 CSS 的标题转换为标准标题标签。
 
         Args:
-            soup_content: BeautifulSoup 内容元素。
+            content: lxml 内容元素。
         """
-        for p in list(soup_content.find_all('p')):
-            title_level = self._is_title_element(p)
-            if title_level:
-                text = p.get_text().strip()
-                new_tag = self._current_soup.new_tag(f'h{min(title_level, 6)}')
-                new_tag.string = text
-                p.replace_with(new_tag)
+        self._paragraph_cache.clear()
+        for p in list(content.iterdescendants('p')):
+            title = self._is_title_element(p)
+            if title:
+                title_level, text = title
+                new_tag = etree.Element(f'h{min(title_level, 6)}')
+                new_tag.text = text
+                new_tag.tail = p.tail
+                p.getparent().replace(p, new_tag)
+        self._paragraph_cache.clear()
+
+    @classmethod
+    def _process_text(cls, text: Optional[str]) -> str:
+        """处理文本节点，合并连续的空格和制表符。
+
+        Args:
+            text: 元素的 text 或 tail，可能为 None。
 
-    def _process_element(self, element) -> str:
+        Returns:
+            处理后的文本。
+        """
+        if not text:
+            return ''
+        return _RE_WS.sub(' ', cls._collapse_blank(text))
+
+    def _process_element(self, element: etree._Element) -> str:
         """递归处理 HTML 元素并转换为 Markdown。
 
         Args:
-            element: BeautifulSoup 元素。
+            element: lxml 元素。
 
         Returns:
-            Markdown 格式的字符串。
+            Markdown 格式的字符串（不含元素的 tail）。
         """
-        if isinstance(element, NavigableString):
-            text = str(element)
-            return re.sub(r'[ \t]+', ' ', text)
-
-        if not isinstance(element, Tag):
+        # 注释、处理指令等非常规节点不产生输出
+        if not isinstance(element.tag, str):
             return ''
 
-        tag_name = element.name.lower() if element.name else ''
-        return self._convert_tag_to_markdown(element, tag_name)
+        return self._convert_tag_to_markdown(element)
 
-    def _convert_tag_to_markdown(self, element: Tag, tag_name: str) -> str:
+    def _convert_tag_to_markdown(self, element: etree._Element) -> str:
         """将 HTML 标签转换为 Markdown。
 
+        通过 `_TAG_HANDLERS` 按标签名查找处理方法，未登记的标签视为容器，
+        直接处理其子节点。
+
         Args:
             element: HTML 元素。
-            tag_name: 标签名。
 
         Returns:
             Markdown 字符串。
         """
-        # 标题标签
-        if tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            level = int(tag_name[1])
-            text = element.get_text(separator=' ', strip=True)
-            if text:
-                return f"\n\n{'#' * level} {text}\n\n"
-            return ''
-
-        # 段落
-        if tag_name == 'p':
-            text = self._process_children(element).strip()
-            if text:
-                return f'\n\n{text}\n\n'
-            return ''
-
-        # 换行和分隔线
-        if tag_name == 'br':
-            return '  \n'
-        if tag_name == 'hr':
-            return '\n\n---\n\n'
-
-        # 文本样式
-        if tag_name in ['strong', 'b']:
-            text = self._process_children(element).strip()
-            return f'**{text}**' if text else ''
-
-        if tag_name in ['em', 'i']:
-            text = self._process_children(element).strip()
-            return f'*{text}*' if text else ''
-
-        if tag_name == 'u':
-            text = self._process_children(element).strip()
-            return f'<u>{text}</u>' if text else ''
-
-        if tag_name in ['s', 'strike', 'del']:
-            text = self._process_children(element).strip()
-            return f'~~{text}~~' if text else ''
-
-        # 链接
-        if tag_name == 'a':
-            href = element.get('href', '')
-            text = self._process_children(element).strip()
-            if text and href and not href.startswith('#'):
-                return f'[{text}]({href})'
-            return text
-
-        # 图片
-        if tag_name == 'img':
-            src = element.get('src', '')
-            alt = element.get('alt', 'image')
-            if src:
-                new_src = self._get_new_image_path(src)
-                return f'![{alt}]({new_src})'
-            return ''
+        handler = self._TAG_HANDLERS.get(element.tag)
+        if handler is None:
+            return self._process_children(element)
+        return handler(self, element)
+
+    def _convert_heading(self, element: etree._Element) -> str:
+        """转换 h1-h6 标题。"""
+        level = int(element.tag[1])
+        text = self._get_text(element, separator=' ', strip=True)
+        if text:
+            return f"\n\n{'#' * level} {text}\n\n"
+        return ''
 
-        # 列表
-        if tag_name == 'ul':
-            return self._process_unordered_list(element)
-        if tag_name == 'ol':
-            return self._process_ordered_list(element)
-
-        # 引用
-        if tag_name == 'blockquote':
-            text = self._process_children(element).strip()
-            if text:
-                lines = text.split('\n')
-                quoted = '\n'.join(f'> {line}' for line in lines)
-                return f'\n\n{quoted}\n\n'
-            return ''
+    def _convert_paragraph(self, element: etree._Element) -> str:
+        """转换段落。"""
+        text = self._process_children(element).strip()
+        if text:
+            return f'\n\n{text}\n\n'
+        return ''
 
-        # 代码
-        if tag_name == 'pre':
-            code = element.get_text()
-            return f'\n\n```\n{code}\n```\n\n'
+    def _convert_line_break(self, element: etree._Element) -> str:
+        """转换换行。"""
+        return '  \n'
+
+    def _convert_rule(self, element: etree._Element) -> str:
+        """转换分隔线。"""
+        return '\n\n---\n\n'
+
+    def _convert_bold(self, element: etree._Element) -> str:
+        """转换粗体。"""
+        text = self._process_children(element).strip()
+        return f'**{text}**' if text else ''
+
+    def _convert_italic(self, element: etree._Element) -> str:
+        """转换斜体。"""
+        text = self._process_children(element).strip()
+        return f'*{text}*' if text else ''
+
+    def _convert_underline(self, element: etree._Element) -> str:
+        """转换下划线。"""
+        text = self._process_children(element).strip()
+        return f'<u>{text}</u>' if text else ''
+
+    def _convert_strikethrough(self, element: etree._Element) -> str:
+        """转换删除线。"""
+        text = self._process_children(element).strip()
+        return f'~~{text}~~' if text else ''
+
+    def _convert_link(self, element: etree._Element) -> str:
+        """转换链接，页内锚点只保留文本。"""
+        href = element.get('href', '')
+        text = self._process_children(element).strip()
+        if text and href and not href.startswith('#'):
+            return f'[{text}]({href})'
+        return text
+
+    def _convert_image(self, element: etree._Element) -> str:
+        """转换图片并指向提取后的图片路径。"""
+        src = element.get('src', '')
+        alt = element.get('alt', 'image')
+        if src:
+            new_src = self._get_new_image_path(src)
+            return f'![{alt}]({new_src})'
+        return ''
 
-        if tag_name == 'code':
-            if element.parent and element.parent.name == 'pre':
-                return element.get_text()
-            text = element.get_text().strip()
-            return f'`{text}`' if text else ''
+    def _convert_blockquote(self, element: etree._Element) -> str:
+        """转换引用块。"""
+        text = self._process_children(element).strip()
+        if text:
+            lines = text.split('\n')
+            quoted = '\n'.join(f'> {line}' for line in lines)
+            return f'\n\n{quoted}\n\n'
+        return ''
 
-        # 表格
-        if tag_name == 'table':
-            return self._process_table(element)
+    def _convert_pre(self, element: etree._Element) -> str:
+        """转换预格式化代码块，保留原始空白。"""
+        code = self._get_text(element, preserve_whitespace=True)
+        return f'\n\n```\n{code}\n```\n\n'
 
-        # 上下标
-        if tag_name == 'sup':
-            text = self._process_children(element).strip()
-            return f'^{text}^' if text else ''
+    def _convert_code(self, element: etree._Element) -> str:
+        """转换行内代码，位于 pre 中时只输出原始文本。"""
+        parent = element.getparent()
+        if parent is not None and parent.tag == 'pre':
+            return self._get_text(element, preserve_whitespace=True)
+        text = self._get_text(element).strip()
+        return f'`{text}`' if text else ''
 
-        if tag_name == 'sub':
-            text = self._process_children(element).strip()
-            return f'~{text}~' if text else ''
+    def _convert_superscript(self, element: etree._Element) -> str:
+        """转换上标。"""
+        text = self._process_children(element).strip()
+        return f'^{text}^' if text else ''
 
-        # 容器标签，处理子元素
-        return self._process_children(element)
+    def _convert_subscript(self, element: etree._Element) -> str:
+        """转换下标。"""
+        text = self._process_children(element).strip()
+        return f'~{text}~' if text else ''
 
-    def _process_children(self, element: Tag) -> str:
-        """处理元素的所有子元素。
+    def _process_children(self, element: etree._Element) -> str:
+        """处理元素的所有子节点（文本与子元素）。
 
         Args:
-            element: BeautifulSoup 元素。
+            element: lxml 元素。
 
         Returns:
-            子元素转换后的 Markdown 字符串。
+            子节点转换后的 Markdown 字符串。
         """
-        result = []
-        for child in element.children:
-            result.append(self._process_element(child))
+        # 每个节点都会经过这里：预先绑定方法，并直接按标签查表分派，
+        # 省去经由 _process_element 和 _convert_tag_to_markdown 的两层调用
+        process_text = self._process_text
+        process_children = self._process_children
+        handlers = self._TAG_HANDLERS
+        result = [process_text(element.text)]
+        append = result.append
+        for child in element:
+            tag = child.tag
+            if isinstance(tag, str):
+                handler = handlers.get(tag)
+                if handler is None:
+                    append(process_children(child))
+                else:
+                    append(handler(self, child))
+            append(process_text(child.tail))
         return ''.join(result)
 
-    def _process_unordered_list(self, element: Tag) -> str:
+    def _process_blocks(self, element: etree._Element, buf: io.StringIO) -> None:
+        """逐块渲染元素的子节点，每块渲染完成后立即从树中释放。
+
+        容器标签会递归展开，使整章的 DOM 随输出逐步释放，
+        而不是一直保留到整章转换结束。
+
+        Args:
+            element: lxml 容器元素。
+            buf: 按顺序写入 Markdown 的缓冲区。
+        """
+        write = buf.write
+        process_text = self._process_text
+        process_element = self._process_element
+        write(process_text(element.text))
+        while len(element):
+            child = element[0]
+            if child.tag in _CONTAINER_TAGS:
+                self._process_blocks(child, buf)
+            else:
+                write(process_element(child))
+            write(process_text(child.tail))
+            del element[0]
+
+    def _process_unordered_list(self, element: etree._Element) -> str:
         """处理无序列表。
 
         Args:
@@ -693,21 +1201,21 @@ class EpubToMarkdownConverter:
             Markdown 列表字符串。
         """
         items = []
-        for li in element.find_all('li', recursive=False):
+        for li in element.findall('li'):
             item_text = self._process_children(li).strip()
             if item_text:
                 lines = item_text.split('\n')
-                formatted = f'- {lines[0]}'
-                for line in lines[1:]:
-                    if line.strip():
-                        formatted += f'\n  {line.strip()}'
-                items.append(formatted)
+                parts = [f'- {lines[0]}']
+                parts.extend(
+                    f'  {line}' for line in map(str.strip, lines[1:]) if line
+                )
+                items.append('\n'.join(parts))
 
         if items:
             return '\n\n' + '\n'.join(items) + '\n\n'
         return ''
 
-    def _process_ordered_list(self, element: Tag) -> str:
+    def _process_ordered_list(self, element: etree._Element) -> str:
         """处理有序列表。
 
         Args:
@@ -717,34 +1225,34 @@ class EpubToMarkdownConverter:
             Markdown 列表字符串。
         """
         items = []
-        for i, li in enumerate(element.find_all('li', recursive=False), 1):
+        for i, li in enumerate(element.findall('li'), 1):
             item_text = self._process_children(li).strip()
             if item_text:
                 lines = item_text.split('\n')
-                formatted = f'{i}. {lines[0]}'
-                for line in lines[1:]:
-                    if line.strip():
-                        formatted += f'\n   {line.strip()}'
-                items.append(formatted)
+                parts = [f'{i}. {lines[0]}']
+                parts.extend(
+                    f'   {line}' for line in map(str.strip, lines[1:]) if line
+                )
+                items.append('\n'.join(parts))
 
         if items:
             return '\n\n' + '\n'.join(items) + '\n\n'
         return ''
 
-    def _process_table(self, table_element: Tag) -> str:
+    def _process_table(self, table_element: etree._Element) -> str:
         """处理表格元素。
 
         Args:
-            table_element: 表格 BeautifulSoup 元素。
+            table_element: 表格 lxml 元素。
 
         Returns:
             Markdown 格式的表格。
         """
         rows = []
-        for tr in table_element.find_all('tr'):
+        for tr in table_element.iterdescendants('tr'):
             cells = []
-            for cell in tr.find_all(['th', 'td']):
-                cell_text = cell.get_text(separator=' ', strip=True)
+            for cell in tr.iterdescendants('th', 'td'):
+                cell_text = self._get_text(cell, separator=' ', strip=True)
                 cell_text = cell_text.replace('|', '\\|')
                 cells.append(cell_text)
             if cells:
@@ -764,21 +1272,16 @@ class EpubToMarkdownConverter:
 
         return '\n\n' + '\n'.join(md_table) + '\n\n'
 
-    def _is_toc_page(self, html_content: str) -> bool:
+    def _is_toc_page(self, root: etree._Element) -> bool:
         """检测是否是目录页。
 
         Args:
-            html_content: HTML 内容。
+            root: lxml 解析得到的 HTML 根元素。
 
         Returns:
             是否是目录页。
         """
-        soup = BeautifulSoup(html_content, 'lxml')
-        internal_links = soup.find_all(
-            'a',
-            href=lambda x: x and x.startswith('index_split_')
-        )
-        return len(internal_links) > 10
+        return _COUNT_SPLIT_LINKS(root) > 10
 
     def convert(
         self,
@@ -786,18 +1289,64 @@ class EpubToMarkdownConverter:
     ) -> str:
         """执行转换并返回 Markdown 内容。
 
+        成功的结果会被缓存：不传进度回调的重复调用以及随后的 `save`
+        直接复用，不再重新转换。加载失败时不缓存，下次调用会重新尝试；
+        `close` 会清除缓存。
+
         Args:
             progress_callback: 进度回调函数，接收 (进度百分比, 状态消息)。
 
         Returns:
             转换后的 Markdown 字符串。
         """
+        if self._converted is not None and progress_callback is None:
+            return self._converted
+
+        markdown = ''.join(self._iter_markdown_chunks(progress_callback))
+        # 加载失败时来源不会被打开，空结果不缓存
+        self._converted = markdown if self._source is not None else None
+        return markdown
+
+    def _iter_markdown_chunks(
+        self,
+        progress_callback: Optional[Callable[[int, str], None]] = None
+    ) -> Iterator[str]:
+        """执行转换并按顺序逐块产出 Markdown 内容。
+
+        所有块拼接后与整篇生成再清理的结果完全一致：文档末尾可能被
+        清理掉的空白和分隔线会暂缓产出，直到确定其后还有正文。
+
+        Args:
+            progress_callback: 进度回调函数，接收 (进度百分比, 状态消息)。
+
+        Yields:
+            Markdown 内容块。
+        """
+        if self._converted is not None and progress_callback is None:
+            if self._converted:
+                yield self._converted
+            return
+
         self._progress_callback = progress_callback
         self._report_progress(0, '开始加载 EPUB 文件...')
 
         if not self._load_epub():
-            return ''
+            return
 
+        try:
+            yield from self._iter_book_chunks()
+        finally:
+            # 转换过程中会释放书中的图片与章节内容，再次转换时需要重新加载
+            self._book = None
+
+        self._report_progress(100, '转换完成！')
+
+    def _iter_book_chunks(self) -> Iterator[str]:
+        """对已加载的书籍执行转换并逐块产出 Markdown 内容。
+
+        Yields:
+            Markdown 内容块。
+        """
         self._markdown_content = []
         self._report_progress(10, '提取图片...')
 
@@ -829,27 +1378,155 @@ class EpubToMarkdownConverter:
         self._report_progress(40, '转换文档内容...')
         ordered_items = self._get_ordered_items()
 
-        total_items = len(ordered_items)
-        for i, item in enumerate(ordered_items):
-            progress = 40 + int((i / total_items) * 50)
-            self._report_progress(progress, f'正在转换: {item.get_name()}')
-
-            content = item.get_content().decode('utf-8', errors='ignore')
+        has_parts = bool(self._markdown_content)
+        pending = _RE_MULTI_NL.sub('\n\n', '\n'.join(self._markdown_content))
+        self._markdown_content = []
+        started = False
 
-            if self._is_toc_page(content):
+        for markdown in self._convert_chapters(ordered_items):
+            if not markdown.strip():
                 continue
 
-            markdown = self._html_to_markdown(content)
-            if markdown.strip():
-                self._markdown_content.append(markdown)
-                self._markdown_content.append('\n\n---\n\n')
+            piece = f'{markdown}\n{_CHAPTER_SEPARATOR}'
+            pending = f'{pending}\n{piece}' if has_parts else piece
+            has_parts = True
+            pending = _RE_MULTI_NL.sub('\n\n', pending)
+
+            # 产出确定不会再变化的部分，末尾的空白与分隔线留待后续处理
+            cut = _RE_PENDING_TAIL.search(pending).start()
+            if cut:
+                chunk = pending[:cut]
+                pending = pending[cut:]
+                if not started:
+                    chunk = chunk.lstrip()
+                    started = True
+                yield chunk
+
+        tail = _RE_TRAIL_DIV.sub('', pending)
+        tail = tail.rstrip() if started else tail.strip()
+        if tail:
+            yield tail
+
+    def _convert_chapter(self, content: bytes) -> str:
+        """转换单个章节。
 
-        result = '\n'.join(self._markdown_content)
-        result = re.sub(r'\n{3,}', '\n\n', result)
-        result = re.sub(r'(\n---\n)+$', '', result)
+        Args:
+            content: 章节 HTML 内容。
 
-        self._report_progress(100, '转换完成！')
-        return result.strip()
+        Returns:
+            章节的 Markdown 内容，目录页返回空字符串。
+        """
+        # 只解析一次，目录页检测与转换共用同一棵文档树
+        root = etree.fromstring(content, _HTML_PARSER)
+        if root is None or self._is_toc_page(root):
+            return ''
+        return self._html_to_markdown(root)
+
+    def _convert_chapters(self, items: list) -> Iterator[str]:
+        """按阅读顺序转换所有章节。
+
+        章节之间相互独立，工作进程数大于 1 且章节数不少于
+        `_MIN_PARALLEL_CHAPTERS` 时使用进程池并行转换，结果仍按 spine
+        顺序产出，每个章节在其之前的章节都完成后即可取得。已提交但尚未
+        产出的章节不超过工作进程数的 `_CHAPTERS_PER_WORKER` 倍，内存占用
+        不随章节总数增长。
+
+        Args:
+            items: 按阅读顺序排列的文档项。
+
+        Yields:
+            与 items 一一对应的 Markdown 内容。
+        """
+        total_items = len(items)
+        # 并行需要显式开启，默认在当前进程中顺序转换
+        num_workers = self.options.num_workers
+        if num_workers is None:
+            num_workers = 1
+        elif num_workers == 0:
+            num_workers = os.cpu_count() or 1
+        num_workers = min(num_workers, total_items)
+
+        if num_workers <= 1 or total_items < _MIN_PARALLEL_CHAPTERS:
+            for i, item in enumerate(items):
+                progress = 40 + int((i / total_items) * 50)
+                self._report_progress(progress, f'正在转换: {item.get_name()}')
+                yield self._convert_chapter(self._take_content(item))
+            return
+
+        window = num_workers * _CHAPTERS_PER_WORKER
+        pending: dict[Future, int] = {}
+        results: dict[int, str] = {}
+        next_submit = 0
+        next_index = 0
+        done = 0
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_chapter_worker,
+            initargs=(self._chapter_worker_state(),)
+        ) as executor:
+            while next_index < total_items:
+                # 只提交距下一个待产出章节不超过 window 的章节，
+                # 在途任务与等待前序章节的结果都有上限
+                while (next_submit < total_items
+                       and next_submit < next_index + window):
+                    future = executor.submit(
+                        _convert_chapter_in_worker,
+                        self._take_content(items[next_submit])
+                    )
+                    pending[future] = next_submit
+                    next_submit += 1
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i = pending.pop(future)
+                    results[i] = future.result()
+                    done += 1
+                    progress = 40 + int((done / total_items) * 50)
+                    self._report_progress(
+                        progress,
+                        f'正在转换: {items[i].get_name()}'
+                    )
+                # 结果已移入 results，不再持有已完成的 Future，
+                # 章节产出后其 Markdown 即可释放
+                del finished, future
+
+                while next_index in results:
+                    yield results.pop(next_index)
+                    next_index += 1
+
+    @staticmethod
+    def _take_content(item: epub.EpubItem) -> bytes:
+        """取出文档项的内容，并释放 ebooklib 持有的副本。
+
+        ebooklib 在加载时读入全部章节，交给转换后不再需要保留，
+        这样已转换章节的原始 HTML 可以随转换进度逐步释放。
+
+        Args:
+            item: 文档项。
+
+        Returns:
+            文档项的原始内容。
+        """
+        content = item.get_content()
+        item.content = b''
+        return content
+
+    def _chapter_worker_state(self) -> EpubToMarkdownConverter:
+        """构造传给工作进程的转换器副本。
+
+        副本只保留转换章节所需的目录与图片映射，不包含已加载的书籍、
+        打开的内容来源和进度回调，以便序列化。
+
+        Returns:
+            精简后的转换器副本。
+        """
+        state = copy.copy(self)
+        state._book = None
+        state._source = None
+        state._progress_callback = None
+        state._markdown_content = []
+        state._chapter_buffer = io.StringIO()
+        return state
 
     def _add_yaml_front_matter(self, metadata: BookMetadata) -> None:
         """添加 YAML 前置数据。
@@ -857,16 +1534,17 @@ class EpubToMarkdownConverter:
         Args:
             metadata: 书籍元数据。
         """
-        self._markdown_content.append('---')
+        content = self._markdown_content
+        content.append('---')
         for key, value in metadata.to_dict().items():
-            if '\n' in str(value):
-                self._markdown_content.append(f'{key}: |')
-                for line in str(value).split('\n'):
-                    self._markdown_content.append(f'  {line}')
+            value_str = str(value)
+            if '\n' in value_str:
+                content.append(f'{key}: |')
+                content.extend(f'  {line}' for line in value_str.split('\n'))
             else:
-                value_str = str(value).replace('"', '\\"')
-                self._markdown_content.append(f'{key}: "{value_str}"')
-        self._markdown_content.append('---\n')
+                value_str = value_str.replace('"', '\\"')
+                content.append(f'{key}: "{value_str}"')
+        content.append('---\n')
 
     def _get_ordered_items(self) -> list:
         """获取按阅读顺序排列的文档项。
@@ -874,24 +1552,20 @@ class EpubToMarkdownConverter:
         Returns:
             文档项列表。
         """
-        spine_items = []
-        for item in self._book.get_items():
-            if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                spine_items.append(item)
-
+        # ebooklib 的 get_item_with_id 是线性查找，这里自建 id 索引
+        documents = list(self._book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+        id_to_item = {item.get_id(): item for item in documents}
         spine_ids = [item_id for item_id, _ in self._book.spine]
-        ordered_items = []
 
-        id_to_item = {item.get_id(): item for item in spine_items}
-        for item_id in spine_ids:
-            if item_id in id_to_item:
-                ordered_items.append(id_to_item[item_id])
+        ordered_items = [
+            id_to_item[item_id] for item_id in spine_ids if item_id in id_to_item
+        ]
 
+        # 不在 spine 中的文档按清单顺序追加在最后
         spine_id_set = set(spine_ids)
-        for item in spine_items:
-            if item.get_id() not in spine_id_set:
-                ordered_items.append(item)
-
+        ordered_items.extend(
+            item for item in documents if item.get_id() not in spine_id_set
+        )
         return ordered_items
 
     def save(
@@ -901,6 +1575,9 @@ class EpubToMarkdownConverter:
     ) -> ConversionResult:
         """保存转换结果到文件。
 
+        Markdown 边转换边写入文件，内存中不保留完整的文档。
+        文件读写失败以失败的 ConversionResult 返回，其他异常直接抛出。
+
         Args:
             output_path: 输出文件路径。
             progress_callback: 进度回调函数。
@@ -910,31 +1587,119 @@ class EpubToMarkdownConverter:
         """
         output_path = Path(output_path)
         self._output_dir = output_path.parent
-        self._output_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            markdown = self.convert(progress_callback)
-            if not markdown:
-                return ConversionResult(
-                    success=False,
-                    error_message='转换结果为空'
-                )
-
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown)
-
-            image_count = 0
-            if self.options.extract_images and self._images:
-                image_count = self._save_images(self._output_dir)
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            written = self._write_markdown_stream(output_path, progress_callback)
+        except OSError as e:
+            return ConversionResult(success=False, error_message=str(e))
 
-            return ConversionResult(
-                success=True,
-                markdown_path=output_path,
-                image_count=image_count
-            )
-
-        except Exception as e:
+        if not written:
             return ConversionResult(
                 success=False,
-                error_message=str(e)
+                error_message='转换结果为空'
             )
+
+        image_count = 0
+        warnings: list[str] = []
+        if self.options.extract_images and self._images:
+            try:
+                image_count = self._save_images(self._output_dir, warnings)
+            except OSError as e:
+                return ConversionResult(success=False, error_message=str(e))
+
+        return ConversionResult(
+            success=True,
+            markdown_path=output_path,
+            image_count=image_count,
+            warnings=warnings
+        )
+
+    def _write_markdown_stream(
+        self,
+        output_path: Path,
+        progress_callback: Optional[Callable[[int, str], None]] = None
+    ) -> bool:
+        """边转换边将 Markdown 写入文件。
+
+        每个内容块产出后立即编码为 UTF-8 以二进制写入并释放；
+        没有任何内容时不创建文件，转换中途失败时删除已写入的部分。
+
+        Args:
+            output_path: 输出文件路径。
+            progress_callback: 进度回调函数。
+
+        Returns:
+            是否写入了内容。
+        """
+        f = None
+        try:
+            for chunk in self._iter_markdown_chunks(progress_callback):
+                if f is None:
+                    f = open(output_path, 'wb')
+                f.write(chunk.encode('utf-8'))
+        except BaseException:
+            if f is not None:
+                f.close()
+                output_path.unlink()
+            raise
+        if f is not None:
+            f.close()
+        return f is not None
+
+    # 标签名到转换方法的映射，未登记的标签按容器处理
+    _TAG_HANDLERS: dict[str, Callable[[EpubToMarkdownConverter, etree._Element], str]] = {
+        'h1': _convert_heading,
+        'h2': _convert_heading,
+        'h3': _convert_heading,
+        'h4': _convert_heading,
+        'h5': _convert_heading,
+        'h6': _convert_heading,
+        'p': _convert_paragraph,
+        'br': _convert_line_break,
+        'hr': _convert_rule,
+        'strong': _convert_bold,
+        'b': _convert_bold,
+        'em': _convert_italic,
+        'i': _convert_italic,
+        'u': _convert_underline,
+        's': _convert_strikethrough,
+        'strike': _convert_strikethrough,
+        'del': _convert_strikethrough,
+        'a': _convert_link,
+        'img': _convert_image,
+        'ul': _process_unordered_list,
+        'ol': _process_ordered_list,
+        'blockquote': _convert_blockquote,
+        'pre': _convert_pre,
+        'code': _convert_code,
+        'table': _process_table,
+        'sup': _convert_superscript,
+        'sub': _convert_subscript,
+    }
+
+
+# 工作进程中用于转换章节的转换器副本
+_worker_converter: Optional[EpubToMarkdownConverter] = None
+
+
+def _init_chapter_worker(converter: EpubToMarkdownConverter) -> None:
+    """工作进程初始化函数。
+
+    Args:
+        converter: 由主进程传入的精简转换器副本。
+    """
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _convert_chapter_in_worker(content: bytes) -> str:
+    """在工作进程中转换单个章节。
+
+    Args:
+        content: 章节 HTML 内容。
+
+    Returns:
+        章节的 Markdown 内容。
+    """
+    return _worker_converter._convert_chapter(content)
@@ -6,11 +6,18 @@
 
 from __future__ import annotations
 
+import os
+import time
+from functools import lru_cache
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
+from PySide6.QtCore import QObject
+from PySide6.QtCore import QRunnable
 from PySide6.QtCore import Qt
-from PySide6.QtCore import QThread
+from PySide6.QtCore import QThreadPool
+from PySide6.QtCore import QTimer
 from PySide6.QtCore import Signal
 from PySide6.QtCore import Slot
 from PySide6.QtGui import QDragEnterEvent
@@ -35,15 +42,41 @@ from PySide6.QtWidgets import QWidget
 from epub_converter.converter import ConversionOptions
 from epub_converter.converter import ConversionResult
 from epub_converter.converter import EpubToMarkdownConverter
+from epub_converter.utils import format_file_size
 from epub_converter.utils import get_default_output_path
 from epub_converter.utils import open_file
 from epub_converter.utils import open_file_location
 
+# 两次进度信号之间的最小间隔（纳秒），约 30 Hz
+_PROGRESS_INTERVAL_NS = 33_000_000
 
-class ConversionWorker(QThread):
-    """后台转换工作线程。
 
-    在后台线程中执行转换任务，避免阻塞 UI。
+@lru_cache(maxsize=None)
+def _font(
+    pixel_size: int,
+    weight: QFont.Weight = QFont.Weight.Normal
+) -> QFont:
+    """获取指定像素大小和粗细的字体，相同参数只创建一次。
+
+    标签的字号和粗细通过 setFont 设置，不再为每个标签解析一份样式表。
+
+    Args:
+        pixel_size: 字体像素大小。
+        weight: 字体粗细。
+
+    Returns:
+        字体对象。
+    """
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    return font
+
+
+class WorkerSignals(QObject):
+    """转换任务的信号集合。
+
+    QRunnable 不是 QObject，无法直接定义信号，因此由该对象代为发送。
 
     Signals:
         progress: 进度更新信号 (百分比, 消息)。
@@ -55,13 +88,21 @@ class ConversionWorker(QThread):
     finished = Signal(object)
     error = Signal(str)
 
+
+class ConversionWorker(QRunnable):
+    """后台转换任务。
+
+    提交到线程池中执行转换任务，避免阻塞 UI。
+    通过 signals 属性上的信号报告进度和结果。
+    """
+
     def __init__(
         self,
         epub_path: Path,
         output_path: Path,
         options: ConversionOptions
     ) -> None:
-        """初始化工作线程。
+        """初始化转换任务。
 
         Args:
             epub_path: EPUB 文件路径。
@@ -69,25 +110,79 @@ class ConversionWorker(QThread):
             options: 转换选项。
         """
         super().__init__()
+        self.signals = WorkerSignals()
         self._epub_path = epub_path
         self._output_path = output_path
         self._options = options
+        self._last_emit_ns = 0
 
     def run(self) -> None:
         """执行转换任务。"""
         try:
-            converter = EpubToMarkdownConverter(self._epub_path, self._options)
-            result = converter.save(
-                self._output_path,
-                progress_callback=self._on_progress
-            )
-            self.finished.emit(result)
+            with EpubToMarkdownConverter(
+                self._epub_path,
+                self._options
+            ) as converter:
+                result = converter.save(
+                    self._output_path,
+                    progress_callback=self._on_progress
+                )
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
     def _on_progress(self, percentage: int, message: str) -> None:
-        """进度回调。"""
-        self.progress.emit(percentage, message)
+        """进度回调。
+
+        章节较多时回调非常频繁，这里把跨线程的信号限制在约 30 Hz，
+        100% 的完成进度总是会发出。
+        """
+        now = time.monotonic_ns()
+        if (percentage < 100 and
+                now - self._last_emit_ns < _PROGRESS_INTERVAL_NS):
+            return
+        self._last_emit_ns = now
+        self.signals.progress.emit(percentage, message)
+
+
+class FileStatSignals(QObject):
+    """文件信息读取任务的信号集合。
+
+    Signals:
+        finished: 读取完成信号 (文件路径, 文件大小)。文件大小可能超过
+            32 位整数范围，因此以 object 传递。
+        error: 错误信号 (文件路径, 错误消息)。
+    """
+
+    finished = Signal(str, object)
+    error = Signal(str, str)
+
+
+class FileStatTask(QRunnable):
+    """在后台读取文件大小的任务。
+
+    网络共享等慢速位置上的 stat 可能耗时较长，放到线程池中执行，
+    避免拖入或选择文件时阻塞 UI。
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """初始化读取任务。
+
+        Args:
+            file_path: 要读取的文件路径。
+        """
+        super().__init__()
+        self.signals = FileStatSignals()
+        self._file_path = file_path
+
+    def run(self) -> None:
+        """读取文件大小。"""
+        try:
+            file_size = os.stat(self._file_path).st_size
+        except OSError as e:
+            self.signals.error.emit(self._file_path, str(e))
+            return
+        self.signals.finished.emit(self._file_path, file_size)
 
 
 class DropArea(QFrame):
@@ -103,28 +198,42 @@ class DropArea(QFrame):
     file_dropped = Signal(str)
     clicked = Signal()
 
+    # 空闲与拖入悬停两种状态的样式表
+    _STYLE_IDLE = '''
+        DropArea {
+            background-color: #f8fafc;
+            border: 2px dashed #cbd5e1;
+            border-radius: 12px;
+        }
+        DropArea:hover {
+            background-color: #f1f5f9;
+            border-color: #94a3b8;
+        }
+    '''
+    _STYLE_HOVER = '''
+        DropArea {
+            background-color: #dbeafe;
+            border: 2px dashed #3b82f6;
+            border-radius: 12px;
+        }
+    '''
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """初始化拖放区域。"""
         super().__init__(parent)
         self.setAcceptDrops(True)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._drag_active = False
+        # 拖入时已校验过扩展名的文件路径，放下时直接使用
+        self._drag_path = ''
         self._setup_ui()
+        self._connect_signals()
 
     def _setup_ui(self) -> None:
         """设置界面。"""
         self.setMinimumHeight(200)
         self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet('''
-            DropArea {
-                background-color: #f8fafc;
-                border: 2px dashed #cbd5e1;
-                border-radius: 12px;
-            }
-            DropArea:hover {
-                background-color: #f1f5f9;
-                border-color: #94a3b8;
-            }
-        ''')
+        self.setStyleSheet(self._STYLE_IDLE)
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -132,30 +241,26 @@ class DropArea(QFrame):
 
         # 图标标签
         icon_label = QLabel('📁')
-        icon_label.setStyleSheet('font-size: 48px; border: none;')
+        icon_label.setFont(_font(48))
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(icon_label)
 
         # 主提示文字
         main_text = QLabel('将 EPUB 文件拖拽到此处')
-        main_text.setStyleSheet('''
-            font-size: 18px;
-            font-weight: 600;
-            color: #334155;
-            border: none;
-        ''')
+        main_text.setFont(_font(18, QFont.Weight.DemiBold))
         main_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(main_text)
 
         # 分隔文字
         or_text = QLabel('或')
-        or_text.setStyleSheet('font-size: 14px; color: #94a3b8; border: none;')
+        or_text.setObjectName('hintLabel')
+        or_text.setFont(_font(14))
         or_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(or_text)
 
         # 选择文件按钮
-        select_btn = QPushButton('选择文件')
-        select_btn.setStyleSheet('''
+        self._select_btn = QPushButton('选择文件')
+        self._select_btn.setStyleSheet('''
             QPushButton {
                 background-color: #3b82f6;
                 color: white;
@@ -172,57 +277,59 @@ class DropArea(QFrame):
                 background-color: #1d4ed8;
             }
         ''')
-        select_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        select_btn.clicked.connect(self.clicked.emit)
-        layout.addWidget(select_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        self._select_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(
+            self._select_btn,
+            alignment=Qt.AlignmentFlag.AlignCenter
+        )
+
+    def _connect_signals(self) -> None:
+        """连接信号和槽。"""
+        self._select_btn.clicked.connect(self.clicked.emit)
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """处理拖入事件。"""
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
-            if urls and urls[0].toLocalFile().lower().endswith('.epub'):
+            file_path = urls[0].toLocalFile() if urls else ''
+            if file_path.lower().endswith('.epub'):
+                self._drag_path = file_path
                 event.acceptProposedAction()
-                self.setStyleSheet('''
-                    DropArea {
-                        background-color: #dbeafe;
-                        border: 2px dashed #3b82f6;
-                        border-radius: 12px;
-                    }
-                ''')
+                if not self._drag_active:
+                    self._drag_active = True
+                    self.setStyleSheet(self._STYLE_HOVER)
 
     def dragLeaveEvent(self, event) -> None:
         """处理拖离事件。"""
-        self.setStyleSheet('''
-            DropArea {
-                background-color: #f8fafc;
-                border: 2px dashed #cbd5e1;
-                border-radius: 12px;
-            }
-            DropArea:hover {
-                background-color: #f1f5f9;
-                border-color: #94a3b8;
-            }
-        ''')
+        self._drag_path = ''
+        self._reset_style()
 
     def dropEvent(self, event: QDropEvent) -> None:
-        """处理放下事件。"""
-        self.setStyleSheet('''
-            DropArea {
-                background-color: #f8fafc;
-                border: 2px dashed #cbd5e1;
-                border-radius: 12px;
-            }
-            DropArea:hover {
-                background-color: #f1f5f9;
-                border-color: #94a3b8;
-            }
-        ''')
+        """处理放下事件。
 
-        urls = event.mimeData().urls()
-        if urls:
-            file_path = urls[0].toLocalFile()
-            if file_path.lower().endswith('.epub'):
-                self.file_dropped.emit(file_path)
+        只取出文件路径就立即返回，样式恢复和文件处理推迟到事件循环的
+        下一轮执行，让拖放来源的文件管理器尽快解除阻塞。
+        """
+        QTimer.singleShot(0, self._finish_drop)
+
+    def _finish_drop(self) -> None:
+        """恢复样式并发出文件拖放信号。"""
+        # 只有在 dragEnterEvent 中接受过的拖放才会到达这里
+        file_path = self._drag_path
+        self._drag_path = ''
+
+        self._reset_style()
+        if file_path:
+            self.file_dropped.emit(file_path)
+
+    def _reset_style(self) -> None:
+        """恢复空闲状态的样式。
+
+        只在拖入状态下才重设样式表，避免 Qt 重复解析同一份样式。
+        """
+        if self._drag_active:
+            self._drag_active = False
+            self.setStyleSheet(self._STYLE_IDLE)
 
     def mousePressEvent(self, event) -> None:
         """处理鼠标点击事件。"""
@@ -237,11 +344,40 @@ class MainWindow(QMainWindow):
     面向普通用户设计，操作简单直观。
     """
 
+    # 文件信息标签在未选择与已选择两种状态下的样式表，字号通过 setFont 设置
+    _STYLE_FILE_IDLE = '''
+        color: #64748b;
+        padding: 8px;
+    '''
+    _STYLE_FILE_SELECTED = '''
+        color: #059669;
+        padding: 8px;
+        background-color: #ecfdf5;
+        border-radius: 6px;
+    '''
+
+    # 状态标签在正常与出错两种状态下的样式表，字号通过 setFont 设置
+    _STYLE_STATUS_NORMAL = 'color: #64748b;'
+    _STYLE_STATUS_ERROR = 'color: #dc2626;'
+
     def __init__(self) -> None:
         """初始化主窗口。"""
         super().__init__()
         self._current_file: Optional[Path] = None
-        self._worker: Optional[ConversionWorker] = None
+        # 正在后台读取信息的文件，只接受最后一次选择的结果
+        self._pending_file: Optional[str] = None
+        # 所有转换共用一个单线程的线程池，避免每次转换都新建线程
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        # 读取文件信息、调用外壳程序等可能阻塞的 I/O 共用一个小线程池
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(2)
+        # 进度条、状态标签和成功对话框在第一次转换时才创建
+        self._progress_bar: Optional[QProgressBar] = None
+        self._status_label: Optional[QLabel] = None
+        self._success_msg_box: Optional[QMessageBox] = None
+        # 成功对话框当前展示的转换结果，对话框关闭时使用
+        self._last_result: Optional[ConversionResult] = None
 
         self._setup_ui()
         self._connect_signals()
@@ -260,6 +396,15 @@ class MainWindow(QMainWindow):
             QLabel {
                 color: #334155;
             }
+            QLabel#titleLabel {
+                color: #1e293b;
+            }
+            QLabel#subtitleLabel {
+                color: #64748b;
+            }
+            QLabel#hintLabel {
+                color: #94a3b8;
+            }
             QGroupBox {
                 font-weight: 600;
                 border: 1px solid #e2e8f0;
@@ -293,20 +438,15 @@ class MainWindow(QMainWindow):
 
         # 标题
         title_label = QLabel('EPUB 转 Markdown')
-        title_label.setStyleSheet('''
-            font-size: 24px;
-            font-weight: 700;
-            color: #1e293b;
-        ''')
+        title_label.setObjectName('titleLabel')
+        title_label.setFont(_font(24, QFont.Weight.Bold))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(title_label)
 
         # 副标题
         subtitle_label = QLabel('轻松将电子书转换为 Markdown 格式')
-        subtitle_label.setStyleSheet('''
-            font-size: 14px;
-            color: #64748b;
-        ''')
+        subtitle_label.setObjectName('subtitleLabel')
+        subtitle_label.setFont(_font(14))
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(subtitle_label)
 
@@ -318,11 +458,8 @@ class MainWindow(QMainWindow):
 
         # 文件信息标签
         self._file_info_label = QLabel('未选择文件')
-        self._file_info_label.setStyleSheet('''
-            font-size: 13px;
-            color: #64748b;
-            padding: 8px;
-        ''')
+        self._file_info_label.setFont(_font(13))
+        self._file_info_label.setStyleSheet(self._STYLE_FILE_IDLE)
         self._file_info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(self._file_info_label)
 
@@ -376,6 +513,27 @@ class MainWindow(QMainWindow):
         ''')
         main_layout.addWidget(self._convert_btn)
 
+        # 进度区域占位，控件由 _ensure_progress_ui 按需插入
+        self._progress_layout = QVBoxLayout()
+        self._progress_layout.setContentsMargins(0, 0, 0, 0)
+        self._progress_layout.setSpacing(main_layout.spacing())
+        main_layout.addLayout(self._progress_layout)
+
+        # 弹簧
+        main_layout.addStretch()
+
+        # 版本信息
+        version_label = QLabel('v2.0.0 | 开源项目')
+        version_label.setObjectName('hintLabel')
+        version_label.setFont(_font(12))
+        version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(version_label)
+
+    def _ensure_progress_ui(self) -> None:
+        """在第一次转换时创建进度条和状态标签。"""
+        if self._progress_bar is not None:
+            return
+
         # 进度条
         self._progress_bar = QProgressBar()
         self._progress_bar.setVisible(False)
@@ -392,33 +550,19 @@ class MainWindow(QMainWindow):
                 border-radius: 4px;
             }
         ''')
-        main_layout.addWidget(self._progress_bar)
+        self._progress_layout.addWidget(self._progress_bar)
 
         # 状态标签
         self._status_label = QLabel('')
-        self._status_label.setStyleSheet('''
-            font-size: 13px;
-            color: #64748b;
-        ''')
+        self._status_label.setFont(_font(13))
+        self._status_label.setStyleSheet(self._STYLE_STATUS_NORMAL)
         self._status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._status_label.setVisible(False)
-        main_layout.addWidget(self._status_label)
-
-        # 弹簧
-        main_layout.addStretch()
-
-        # 版本信息
-        version_label = QLabel('v2.0.0 | 开源项目')
-        version_label.setStyleSheet('''
-            font-size: 12px;
-            color: #94a3b8;
-        ''')
-        version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_layout.addWidget(version_label)
+        self._progress_layout.addWidget(self._status_label)
 
     def _connect_signals(self) -> None:
         """连接信号和槽。"""
-        self._drop_area.file_dropped.connect(self._on_file_selected)
+        self._drop_area.file_dropped.connect(self._on_file_chosen)
         self._drop_area.clicked.connect(self._on_select_file_clicked)
         self._convert_btn.clicked.connect(self._on_convert_clicked)
 
@@ -432,39 +576,63 @@ class MainWindow(QMainWindow):
             'EPUB 文件 (*.epub);;所有文件 (*.*)'
         )
         if file_path:
-            self._on_file_selected(file_path)
+            self._on_file_chosen(file_path)
 
     @Slot(str)
-    def _on_file_selected(self, file_path: str) -> None:
+    def _on_file_chosen(self, file_path: str) -> None:
+        """在后台读取所选文件的信息。
+
+        Args:
+            file_path: 选择的文件路径。
+        """
+        self._pending_file = file_path
+        task = FileStatTask(file_path)
+        queued = Qt.ConnectionType.QueuedConnection
+        task.signals.finished.connect(self._on_file_selected, queued)
+        task.signals.error.connect(self._on_file_stat_error, queued)
+        self._io_pool.start(task)
+
+    @Slot(str, object)
+    def _on_file_selected(self, file_path: str, file_size: int) -> None:
         """处理文件选择。
 
         Args:
             file_path: 选择的文件路径。
+            file_size: 后台读取到的文件大小（字节）。
         """
+        if file_path != self._pending_file:
+            return
+        self._pending_file = None
+
+        first_selection = self._current_file is None
         self._current_file = Path(file_path)
         file_name = self._current_file.name
-        file_size = self._current_file.stat().st_size
-        size_str = self._format_size(file_size)
+        size_str = format_file_size(file_size)
 
         self._file_info_label.setText(f'📖 {file_name} ({size_str})')
-        self._file_info_label.setStyleSheet('''
-            font-size: 13px;
-            color: #059669;
-            padding: 8px;
-            background-color: #ecfdf5;
-            border-radius: 6px;
-        ''')
+        # 样式只在第一次选中文件时切换，之后重复选择不再重新解析
+        if first_selection:
+            self._file_info_label.setStyleSheet(self._STYLE_FILE_SELECTED)
 
         self._convert_btn.setEnabled(True)
 
-    @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        """格式化文件大小。"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024:
-                return f'{size_bytes:.1f} {unit}'
-            size_bytes /= 1024
-        return f'{size_bytes:.1f} TB'
+    @Slot(str, str)
+    def _on_file_stat_error(self, file_path: str, error_message: str) -> None:
+        """处理读取文件信息失败。
+
+        Args:
+            file_path: 选择的文件路径。
+            error_message: 错误消息。
+        """
+        if file_path != self._pending_file:
+            return
+        self._pending_file = None
+
+        QMessageBox.warning(
+            self,
+            '无法读取文件',
+            f'读取文件信息时发生错误:\n{error_message}'
+        )
 
     @Slot()
     def _on_convert_clicked(self) -> None:
@@ -495,22 +663,25 @@ class MainWindow(QMainWindow):
         )
 
         # 禁用界面
+        self._ensure_progress_ui()
         self._convert_btn.setEnabled(False)
         self._convert_btn.setText('转换中...')
         self._progress_bar.setVisible(True)
         self._progress_bar.setValue(0)
         self._status_label.setVisible(True)
 
-        # 启动工作线程
-        self._worker = ConversionWorker(
+        # 提交转换任务
+        worker = ConversionWorker(
             self._current_file,
             output_path,
             options
         )
-        self._worker.progress.connect(self._on_progress)
-        self._worker.finished.connect(self._on_conversion_finished)
-        self._worker.error.connect(self._on_conversion_error)
-        self._worker.start()
+        # 信号总是从线程池发回 GUI 线程，直接指定排队连接
+        queued = Qt.ConnectionType.QueuedConnection
+        worker.signals.progress.connect(self._on_progress, queued)
+        worker.signals.finished.connect(self._on_conversion_finished, queued)
+        worker.signals.error.connect(self._on_conversion_error, queued)
+        self._pool.start(worker)
 
     @Slot(int, str)
     def _on_progress(self, percentage: int, message: str) -> None:
@@ -520,7 +691,8 @@ class MainWindow(QMainWindow):
             percentage: 进度百分比。
             message: 状态消息。
         """
-        self._progress_bar.setValue(percentage)
+        if self._progress_bar.value() != percentage:
+            self._progress_bar.setValue(percentage)
         self._status_label.setText(message)
 
     @Slot(object)
@@ -542,10 +714,7 @@ class MainWindow(QMainWindow):
         else:
             self._progress_bar.setVisible(False)
             self._status_label.setText(f'转换失败: {result.error_message}')
-            self._status_label.setStyleSheet('''
-                font-size: 13px;
-                color: #dc2626;
-            ''')
+            self._status_label.setStyleSheet(self._STYLE_STATUS_ERROR)
 
             QMessageBox.warning(
                 self,
@@ -564,10 +733,7 @@ class MainWindow(QMainWindow):
         self._convert_btn.setText('开始转换')
         self._progress_bar.setVisible(False)
         self._status_label.setText(f'错误: {error_message}')
-        self._status_label.setStyleSheet('''
-            font-size: 13px;
-            color: #dc2626;
-        ''')
+        self._status_label.setStyleSheet(self._STYLE_STATUS_ERROR)
 
         QMessageBox.critical(
             self,
@@ -578,12 +744,14 @@ class MainWindow(QMainWindow):
     def _show_success_dialog(self, result: ConversionResult) -> None:
         """显示转换成功对话框。
 
+        对话框以窗口模态方式打开后立即返回，不进入嵌套事件循环，
+        按钮的处理在 _on_success_dialog_finished 中完成。
+
         Args:
             result: 转换结果。
         """
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle('转换成功')
-        msg_box.setIcon(QMessageBox.Icon.Information)
+        msg_box = self._get_success_msg_box()
+        self._last_result = result
 
         text = f'✅ 转换完成！\n\n'
         text += f'📄 文件: {result.markdown_path.name}\n'
@@ -592,33 +760,60 @@ class MainWindow(QMainWindow):
         text += f'📁 位置: {result.markdown_path.parent}'
 
         msg_box.setText(text)
+        msg_box.open()
 
-        open_folder_btn = msg_box.addButton(
-            '打开文件夹',
-            QMessageBox.ButtonRole.ActionRole
-        )
-        open_file_btn = msg_box.addButton(
-            '打开文件',
-            QMessageBox.ButtonRole.ActionRole
-        )
-        close_btn = msg_box.addButton(
-            '关闭',
-            QMessageBox.ButtonRole.RejectRole
-        )
+    @Slot(int)
+    def _on_success_dialog_finished(self, _result_code: int) -> None:
+        """处理转换成功对话框关闭。
 
-        msg_box.exec()
+        Args:
+            _result_code: 对话框的返回码，按钮通过 clickedButton 判断。
+        """
+        result = self._last_result
+        self._last_result = None
+        if result is None:
+            return
 
-        clicked = msg_box.clickedButton()
-        if clicked == open_folder_btn:
-            open_file_location(result.markdown_path)
-        elif clicked == open_file_btn:
-            open_file(result.markdown_path)
+        # 打开文件或文件夹会检查路径并启动外壳程序，放到 I/O 线程池中执行
+        markdown_path = result.markdown_path
+        clicked = self._success_msg_box.clickedButton()
+        if clicked == self._open_folder_btn:
+            self._io_pool.start(partial(open_file_location, markdown_path))
+        elif clicked == self._open_file_btn:
+            self._io_pool.start(partial(open_file, markdown_path))
 
         # 如果勾选了自动打开文件夹
         if (self._open_folder_cb.isChecked() and
-                clicked == close_btn):
-            open_file_location(result.markdown_path)
+                clicked == self._close_btn):
+            self._io_pool.start(partial(open_file_location, markdown_path))
 
         # 重置状态
         self._progress_bar.setVisible(False)
         self._status_label.setVisible(False)
+
+    def _get_success_msg_box(self) -> QMessageBox:
+        """获取转换成功对话框，第一次调用时创建，之后复用。
+
+        Returns:
+            带有打开文件夹、打开文件和关闭三个按钮的对话框。
+        """
+        if self._success_msg_box is None:
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle('转换成功')
+            msg_box.setIcon(QMessageBox.Icon.Information)
+
+            self._open_folder_btn = msg_box.addButton(
+                '打开文件夹',
+                QMessageBox.ButtonRole.ActionRole
+            )
+            self._open_file_btn = msg_box.addButton(
+                '打开文件',
+                QMessageBox.ButtonRole.ActionRole
+            )
+            self._close_btn = msg_box.addButton(
+                '关闭',
+                QMessageBox.ButtonRole.RejectRole
+            )
+            msg_box.finished.connect(self._on_success_dialog_finished)
+            self._success_msg_box = msg_box
+        return self._success_msg_box
@@ -8,9 +8,13 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
+# 文件大小单位，下标 i 对应 1024 的 i 次方
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 
 def get_default_output_path(epub_path: Path) -> Path:
     """根据 EPUB 文件路径生成默认的输出路径。
@@ -24,6 +28,30 @@ def get_default_output_path(epub_path: Path) -> Path:
     return epub_path.with_suffix('.md')
 
 
+def _spawn_detached(args: list[str]) -> None:
+    """启动外部程序后立即返回，不等待其退出。
+
+    Args:
+        args: 命令及其参数。
+    """
+    subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def _startfile_in_background(path: str) -> None:
+    """在后台线程中调用 os.startfile，避免外壳程序查找关联时阻塞调用方。
+
+    Args:
+        path: 要打开的文件或文件夹路径。
+    """
+    threading.Thread(target=os.startfile, args=(path,), daemon=True).start()
+
+
 def open_file_location(file_path: Path) -> bool:
     """在系统文件管理器中打开文件所在位置。
 
@@ -39,15 +67,15 @@ def open_file_location(file_path: Path) -> bool:
         if sys.platform == 'win32':
             # Windows: 使用 explorer 并选中文件
             if file_path.is_file():
-                subprocess.run(['explorer', '/select,', str(file_path)])
+                _spawn_detached(['explorer', '/select,', str(file_path)])
             else:
-                os.startfile(str(folder_path))
+                _startfile_in_background(str(folder_path))
         elif sys.platform == 'darwin':
             # macOS
-            subprocess.run(['open', str(folder_path)])
+            _spawn_detached(['open', str(folder_path)])
         else:
             # Linux
-            subprocess.run(['xdg-open', str(folder_path)])
+            _spawn_detached(['xdg-open', str(folder_path)])
         return True
     except Exception:
         return False
@@ -64,11 +92,11 @@ def open_file(file_path: Path) -> bool:
     """
     try:
         if sys.platform == 'win32':
-            os.startfile(str(file_path))
+            _startfile_in_background(str(file_path))
         elif sys.platform == 'darwin':
-            subprocess.run(['open', str(file_path)])
+            _spawn_detached(['open', str(file_path)])
         else:
-            subprocess.run(['xdg-open', str(file_path)])
+            _spawn_detached(['xdg-open', str(file_path)])
         return True
     except Exception:
         return False
@@ -83,11 +111,11 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         格式化后的字符串。
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f'{size_bytes:.1f} {unit}'
-        size_bytes /= 1024
-    return f'{size_bytes:.1f} TB'
+    if size_bytes < 1024:
+        return f'{size_bytes:.1f} B'
+    # 用位长度直接算出单位，每 10 位对应一级
+    index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f'{size_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}'
 
 
 def is_valid_epub(file_path: Path) -> bool:
@@ -99,13 +127,10 @@ def is_valid_epub(file_path: Path) -> bool:
     Returns:
         是否是有效的 EPUB 文件。
     """
-    if not file_path.exists():
+    # 先做不需要系统调用的扩展名检查，is_file 对不存在的路径也返回 False
+    if not os.fspath(file_path).lower().endswith('.epub'):
         return False
-    if not file_path.is_file():
-        return False
-    if file_path.suffix.lower() != '.epub':
-        return False
-    return True
+    return file_path.is_file()
 
 
 def ensure_unique_path(file_path: Path) -> Path:
@@ -124,9 +149,16 @@ def ensure_unique_path(file_path: Path) -> Path:
     suffix = file_path.suffix
     parent = file_path.parent
 
+    # 扫描一次目录，按名称精确跳过已存在的编号，代替逐个编号调用 exists()
+    with os.scandir(parent) as entries:
+        existing_names = {entry.name for entry in entries}
+
     counter = 1
     while True:
-        new_path = parent / f'{stem}_{counter}{suffix}'
-        if not new_path.exists():
-            return new_path
+        name = f'{stem}_{counter}{suffix}'
+        if name not in existing_names:
+            new_path = parent / name
+            # 不区分大小写的文件系统上名称不同也可能冲突，最终仍以 exists() 为准
+            if not new_path.exists():
+                return new_path
         counter += 1
@@ -0,0 +1,431 @@
+"""epub_converter.converter 的测试。
+
+测试用的 EPUB 在临时目录中按需生成，不依赖仓库中的样例文件。
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import weakref
+import zipfile
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+# 将 src 目录添加到 Python 路径
+src_dir = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_dir))
+
+from epub_converter.converter import ConversionOptions  # noqa: E402
+from epub_converter.converter import EpubToMarkdownConverter  # noqa: E402
+
+_CONTAINER_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="{opf_path}" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+'''
+
+_OPF_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="id">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:identifier id="id">test-book</dc:identifier>
+    <dc:title>测试书籍</dc:title>
+    <dc:language>zh</dc:language>
+  </metadata>
+  <manifest>
+{manifest}
+  </manifest>
+  <spine>
+{spine}
+  </spine>
+</package>
+'''
+
+_CHAPTER_HTML = '''<?xml version="1.0" encoding="UTF-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>{title}</title></head>
+<body>{body}</body>
+</html>
+'''
+
+# 1x1 像素的 PNG 图片
+_PNG_BYTES = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000d49444154789c6360000002000001e221bc330000'
+    '000049454e44ae426082'
+)
+
+
+def _write_epub(
+    path: Path,
+    chapters: list[tuple[str, str]],
+    images: Optional[dict[str, bytes]] = None,
+    opf_path: str = 'OEBPS/content.opf'
+) -> Path:
+    """在指定位置生成一个最小的 EPUB 文件。
+
+    Args:
+        path: 输出的 EPUB 文件路径。
+        chapters: (相对 OPF 的 href, body HTML) 列表，按阅读顺序排列。
+        images: 相对 OPF 的 href 到图片内容的映射。
+        opf_path: OPF 文件在压缩包中的路径。
+
+    Returns:
+        生成的 EPUB 文件路径。
+    """
+    images = images or {}
+    opf_dir = opf_path.rpartition('/')[0]
+
+    def member(href: str) -> str:
+        joined = f'{opf_dir}/{href}' if opf_dir else href
+        parts: list[str] = []
+        for part in joined.split('/'):
+            if part == '..':
+                parts.pop()
+            elif part not in ('', '.'):
+                parts.append(part)
+        return '/'.join(parts)
+
+    manifest = []
+    spine = []
+    for i, (href, _) in enumerate(chapters):
+        manifest.append(
+            f'    <item id="c{i}" href="{href}" '
+            f'media-type="application/xhtml+xml"/>'
+        )
+        spine.append(f'    <itemref idref="c{i}"/>')
+    for i, href in enumerate(images):
+        manifest.append(
+            f'    <item id="i{i}" href="{href}" media-type="image/png"/>'
+        )
+
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('mimetype', 'application/epub+zip', zipfile.ZIP_STORED)
+        zf.writestr(
+            'META-INF/container.xml',
+            _CONTAINER_XML.format(opf_path=opf_path)
+        )
+        zf.writestr(opf_path, _OPF_XML.format(
+            manifest='\n'.join(manifest),
+            spine='\n'.join(spine)
+        ))
+        for i, (href, body) in enumerate(chapters):
+            zf.writestr(
+                member(href),
+                _CHAPTER_HTML.format(title=f'第{i + 1}章', body=body)
+            )
+        for href, data in images.items():
+            zf.writestr(member(href), data)
+    return path
+
+
+class _FakeChapter:
+    """只提供 `_convert_chapters` 所需接口的文档项。"""
+
+    def __init__(self, name: str, html: str):
+        """创建文档项。
+
+        Args:
+            name: 文档项名称。
+            html: 章节 HTML 内容。
+        """
+        self._name = name
+        self.content = html.encode('utf-8')
+
+    def get_name(self) -> str:
+        """返回文档项名称。"""
+        return self._name
+
+    def get_content(self) -> bytes:
+        """返回文档项内容。"""
+        return self.content
+
+
+class _InlineExecutor:
+    """在提交时立即执行任务的进程池替身，并记录每个 Future 的弱引用。"""
+
+    def __init__(self, max_workers: int, initializer, initargs: tuple):
+        """像工作进程一样调用 initializer。"""
+        initializer(*initargs)
+        self.submitted: list[weakref.ref] = []
+
+    def __enter__(self) -> '_InlineExecutor':
+        """进入上下文管理器。"""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """退出上下文管理器，没有需要清理的资源。"""
+
+    def submit(self, fn, *args) -> Future:
+        """执行任务并返回已完成的 Future。"""
+        future = Future()
+        future.set_result(fn(*args))
+        self.submitted.append(weakref.ref(future))
+        return future
+
+
+class _TempDirTestCase(unittest.TestCase):
+    """为每个测试提供一个临时目录。"""
+
+    def setUp(self) -> None:
+        """创建临时目录。"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        """删除临时目录。"""
+        self._tmp.cleanup()
+
+
+class HtmlToMarkdownTest(_TempDirTestCase):
+    """章节 HTML 到 Markdown 转换的测试。"""
+
+    def setUp(self) -> None:
+        """生成一个最小的 EPUB 并创建转换器。"""
+        super().setUp()
+        epub_path = _write_epub(
+            self.tmp_path / 'book.epub',
+            [('Text/c1.xhtml', '<p>正文</p>')]
+        )
+        self.converter = EpubToMarkdownConverter(epub_path)
+
+    def _convert(self, html: str) -> str:
+        """将 HTML 字符串转换为 Markdown。"""
+        return self.converter._convert_chapter(html.encode('utf-8'))
+
+    def test_removed_element_keeps_text_fragments_apart(self) -> None:
+        """删除 script 等元素后，其前后的文本仍按独立片段处理。"""
+        self.assertEqual(
+            self._convert('<h1>hello hello<script>x</script>短标题</h1>'),
+            '# hello hello 短标题'
+        )
+        self.assertEqual(
+            self._convert(
+                '<table><tr><th>a|b<meta>目录项</th></tr>'
+                '<tr><td>1</td></tr></table>'
+            ),
+            '| a\\|b 目录项 |\n| --- |\n| 1 |'
+        )
+
+    def test_whitespace_after_removed_element_in_table_cell(self) -> None:
+        """表格单元格中被删除元素后的空白按独立片段去除，不会残留制表符。"""
+        self.assertEqual(
+            self._convert(
+                '<table><tr><th>x y<meta>\t1.</th></tr>'
+                '<tr><td>z</td></tr></table>'
+            ),
+            '| x y 1. |\n| --- |\n| z |'
+        )
+
+    def test_removed_element_tail_is_kept(self) -> None:
+        """被删除元素之后的文本保留在段落中。"""
+        self.assertEqual(
+            self._convert('<p>前<style>p {}</style>后</p>'),
+            '前后'
+        )
+
+
+class ImageExportTest(_TempDirTestCase):
+    """图片提取与保存的测试。"""
+
+    def test_relative_image_hrefs_with_opf_in_subdirectory(self) -> None:
+        """OPF 位于子目录、清单中使用 ../ 和 ./ 路径时图片仍能导出。"""
+        epub_path = _write_epub(
+            self.tmp_path / 'book.epub',
+            [(
+                'Text/c1.xhtml',
+                '<p>图一<img src="../../Images/z.png"/></p>'
+                '<p>图二<img src="../Images/y.png"/></p>'
+            )],
+            images={
+                '../Images/z.png': _PNG_BYTES,
+                './Images/y.png': _PNG_BYTES + b'\0',
+            },
+            opf_path='OEBPS/content.opf'
+        )
+        output_path = self.tmp_path / 'out' / 'book.md'
+
+        with EpubToMarkdownConverter(epub_path) as converter:
+            result = converter.save(output_path)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.image_count, 2)
+        self.assertEqual(result.warnings, [])
+        image_dir = output_path.parent / 'images'
+        self.assertEqual((image_dir / 'z.png').read_bytes(), _PNG_BYTES)
+        self.assertEqual((image_dir / 'y.png').read_bytes(), _PNG_BYTES + b'\0')
+        markdown = output_path.read_text(encoding='utf-8')
+        self.assertIn('images/z.png', markdown)
+        self.assertIn('images/y.png', markdown)
+
+    def test_missing_image_is_reported(self) -> None:
+        """读取不到的图片不再被静默忽略，而是记录在结果的警告中。"""
+        epub_path = _write_epub(
+            self.tmp_path / 'book.epub',
+            [('Text/c1.xhtml', '<p>图<img src="../Images/a.png"/></p>')],
+            images={'Images/a.png': _PNG_BYTES}
+        )
+        with EpubToMarkdownConverter(epub_path) as converter:
+            with mock.patch.object(
+                converter,
+                '_open_member',
+                side_effect=KeyError('OEBPS/Images/a.png')
+            ):
+                result = converter.save(self.tmp_path / 'book.md')
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.image_count, 0)
+        self.assertEqual(len(result.warnings), 1)
+        self.assertIn('OEBPS/Images/a.png', result.warnings[0])
+
+    def test_concurrent_saves_write_intact_images(self) -> None:
+        """多个线程同时保存时，各自导出的图片内容互不干扰。"""
+        images = {
+            f'Images/{i}.png': os.urandom(4 << 20) for i in range(3)
+        }
+        body = ''.join(f'<p><img src="../{href}"/></p>' for href in images)
+        epub_path = _write_epub(
+            self.tmp_path / 'book.epub',
+            [('Text/c1.xhtml', body)],
+            images=images
+        )
+        barrier = threading.Barrier(4)
+        results = {}
+
+        def save(index: int) -> None:
+            output_path = self.tmp_path / f'out{index}' / 'book.md'
+            with EpubToMarkdownConverter(epub_path) as converter:
+                converter._load_epub()
+                barrier.wait()
+                results[index] = converter.save(output_path)
+
+        threads = [
+            threading.Thread(target=save, args=(i,)) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for index in range(4):
+            self.assertEqual(results[index].image_count, 3)
+            image_dir = self.tmp_path / f'out{index}' / 'images'
+            for href, data in images.items():
+                written = (image_dir / href.rpartition('/')[2]).read_bytes()
+                self.assertEqual(written, data, f'线程 {index}: {href}')
+
+
+class ChapterConversionTest(_TempDirTestCase):
+    """章节顺序与并行转换的测试。"""
+
+    def _write_book(self) -> Path:
+        """生成一个章节数足以触发并行转换的 EPUB。"""
+        chapters = [
+            (f'Text/c{i}.xhtml', f'<h2>第{i}节</h2><p>内容{i}</p>')
+            for i in range(6)
+        ]
+        return _write_epub(self.tmp_path / 'book.epub', chapters)
+
+    def test_default_options_do_not_start_process_pool(self) -> None:
+        """默认选项在当前进程中顺序转换，不创建进程池。"""
+        epub_path = self._write_book()
+        with mock.patch('os.cpu_count', return_value=4), mock.patch(
+            'epub_converter.converter.ProcessPoolExecutor',
+            side_effect=AssertionError('不应创建进程池')
+        ):
+            with EpubToMarkdownConverter(epub_path) as converter:
+                markdown = converter.convert()
+        self.assertIn('内容5', markdown)
+
+    def test_parallel_output_matches_serial(self) -> None:
+        """显式开启并行转换时输出与顺序转换一致。"""
+        epub_path = self._write_book()
+        with EpubToMarkdownConverter(epub_path) as converter:
+            serial = converter.convert()
+        options = ConversionOptions(num_workers=2)
+        with EpubToMarkdownConverter(epub_path, options) as converter:
+            parallel = converter.convert()
+        self.assertEqual(parallel, serial)
+
+    def test_parallel_releases_futures_of_yielded_chapters(self) -> None:
+        """并行转换产出章节后不再引用其 Future，在途任务数有上限。"""
+        epub_path = self._write_book()
+        items = [
+            _FakeChapter(f'c{i}.xhtml', f'<p>内容{i}</p>') for i in range(12)
+        ]
+        executors = []
+
+        def make_executor(**kwargs) -> _InlineExecutor:
+            executor = _InlineExecutor(**kwargs)
+            executors.append(executor)
+            return executor
+
+        options = ConversionOptions(num_workers=2)
+        converter = EpubToMarkdownConverter(epub_path, options)
+        with mock.patch(
+            'epub_converter.converter.ProcessPoolExecutor',
+            side_effect=make_executor
+        ), mock.patch('epub_converter.converter._worker_converter', None):
+            for i, markdown in enumerate(converter._convert_chapters(items)):
+                self.assertIn(f'内容{i}', markdown)
+                submitted = executors[0].submitted
+                for ref in submitted[:i + 1]:
+                    self.assertIsNone(ref())
+                self.assertLessEqual(len(submitted) - (i + 1), 4)
+        self.assertEqual(len(executors[0].submitted), len(items))
+
+
+class ConversionCacheTest(_TempDirTestCase):
+    """转换结果缓存的测试。"""
+
+    def _write_book(self) -> Path:
+        """生成一个带图片的 EPUB。"""
+        return _write_epub(
+            self.tmp_path / 'book.epub',
+            [('Text/c1.xhtml', '<p>正文<img src="../Images/a.png"/></p>')],
+            images={'Images/a.png': _PNG_BYTES}
+        )
+
+    def test_save_after_convert_and_close(self) -> None:
+        """convert、close 之后再 save 会重新打开 EPUB 并正常导出。"""
+        converter = EpubToMarkdownConverter(self._write_book())
+        markdown = converter.convert()
+        converter.close()
+
+        output_path = self.tmp_path / 'out' / 'book.md'
+        result = converter.save(output_path)
+        converter.close()
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.image_count, 1)
+        self.assertEqual(output_path.read_text(encoding='utf-8'), markdown)
+
+    def test_save_after_metadata_and_close(self) -> None:
+        """读取元数据并 close 之后 save 仍能读取图片。"""
+        converter = EpubToMarkdownConverter(self._write_book())
+        converter.get_metadata()
+        converter.close()
+
+        result = converter.save(self.tmp_path / 'out' / 'book.md')
+        converter.close()
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.image_count, 1)
+
+    def test_failed_load_is_not_cached(self) -> None:
+        """加载失败的结果不会被缓存，之后的调用会重新尝试。"""
+        epub_path = self.tmp_path / 'book.epub'
+        epub_path.write_bytes(b'not a zip file')
+        with EpubToMarkdownConverter(epub_path) as converter:
+            self.assertEqual(converter.convert(), '')
+            self._write_book()
+            self.assertIn('正文', converter.convert())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""epub_converter.utils 的测试。"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# 将 src 目录添加到 Python 路径
+src_dir = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_dir))
+
+from epub_converter.utils import ensure_unique_path  # noqa: E402
+
+
+class EnsureUniquePathTest(unittest.TestCase):
+    """`ensure_unique_path` 的测试。"""
+
+    def setUp(self) -> None:
+        """创建临时目录。"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        """删除临时目录。"""
+        self._tmp.cleanup()
+
+    def _touch(self, *names: str) -> None:
+        """在临时目录中创建空文件。"""
+        for name in names:
+            (self.tmp_path / name).touch()
+
+    def test_missing_path_is_returned_unchanged(self) -> None:
+        """路径不存在时原样返回。"""
+        path = self.tmp_path / 'book.md'
+        self.assertEqual(ensure_unique_path(path), path)
+
+    def test_first_free_number_is_used(self) -> None:
+        """返回第一个未被占用的编号，中间的空缺会被复用。"""
+        self._touch('book.md', 'book_1.md', 'book_3.md')
+        self.assertEqual(
+            ensure_unique_path(self.tmp_path / 'book.md'),
+            self.tmp_path / 'book_2.md'
+        )
+
+    def test_zero_padded_names_do_not_take_a_number(self) -> None:
+        """book_01.md 不占用编号 1。"""
+        self._touch('book.md', 'book_01.md')
+        self.assertEqual(
+            ensure_unique_path(self.tmp_path / 'book.md'),
+            self.tmp_path / 'book_1.md'
+        )
+
+    def test_existing_directory_counts_as_taken(self) -> None:
+        """同名目录同样视为已占用。"""
+        self._touch('book.md')
+        (self.tmp_path / 'book_1.md').mkdir()
+        self.assertEqual(
+            ensure_unique_path(self.tmp_path / 'book.md'),
+            self.tmp_path / 'book_2.md'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()